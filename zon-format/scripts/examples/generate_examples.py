@@ -268,8 +268,8 @@ for ex in examples:
 
     print(f"✅ Generated {ex['name']}")
     print(f"   Description: {ex['desc']}")
-    print(f"   JSON: {len(json_content.encode('utf-8'))} bytes")
-    print(f"   ZON:  {len(zon_content.encode('utf-8'))} bytes")
+    print(f"   JSON: {os.path.getsize(json_path)} bytes")
+    print(f"   ZON:  {os.path.getsize(zon_path)} bytes")
     print('---')
 
 print('\nDone! View the examples in the "examples/" folder.')
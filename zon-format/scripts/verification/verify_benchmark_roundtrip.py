@@ -1,7 +1,10 @@
 import os
 import sys
+import io
 import json
 import difflib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
@@ -61,6 +64,20 @@ def verify_roundtrip(filename):
         traceback.print_exc()
         return False
 
+def _process_file(filename):
+    """Verify one dataset in a worker process, capturing its report.
+    
+    Args:
+        filename: Name of the file to verify.
+        
+    Returns:
+        Tuple of (success flag, printed report).
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        ok = verify_roundtrip(filename)
+    return ok, buffer.getvalue()
+
 def main():
     if not os.path.exists(TS_EXPORT_DIR):
         print(f"Error: {TS_EXPORT_DIR} does not exist. Run export_datasets.js first.")
@@ -69,9 +86,11 @@ def main():
     files = sorted([f for f in os.listdir(TS_EXPORT_DIR) if f.endswith('.json')])
     
     all_match = True
-    for f in files:
-        if not verify_roundtrip(f):
-            all_match = False
+    with ProcessPoolExecutor() as executor:
+        for ok, report in executor.map(_process_file, files):
+            print(report, end='')
+            if not ok:
+                all_match = False
             
     if all_match:
         print("\n🎉 All benchmark datasets passed round-trip verification!")
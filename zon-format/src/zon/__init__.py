@@ -6,6 +6,7 @@ data fidelity and type safety.
 
 Main components:
     - encode/decode: Core encoding and decoding functions
+    - decode_file: Decode a ZON document from a file object line by line
     - ZonEncoder/ZonDecoder: Class-based codec interfaces
     - ZonStreamEncoder/ZonStreamDecoder: Streaming codec for large data
     - LLMOptimizer: Optimize encodings for specific LLM contexts
@@ -15,7 +16,7 @@ Main components:
 """
 
 from .core.encoder import encode, encode_llm, ZonEncoder
-from .core.decoder import decode, ZonDecoder
+from .core.decoder import decode, decode_file, ZonDecoder
 from .core.stream import ZonStreamEncoder, ZonStreamDecoder
 from .llm.optimizer import LLMOptimizer
 from .llm.token_counter import TokenCounter
@@ -31,6 +32,7 @@ __all__ = [
     "encode_llm",
     "ZonEncoder",
     "decode", 
+    "decode_file",
     "ZonDecoder",
     "ZonStreamEncoder",
     "ZonStreamDecoder",
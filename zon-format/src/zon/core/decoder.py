@@ -6,7 +6,10 @@ supporting table reconstruction, sparse data, and type coercion.
 
 import json
 import re
-from typing import List, Dict, Any, Optional, Tuple, Union
+import sys
+from functools import lru_cache
+from itertools import accumulate, chain, islice
+from typing import Callable, Iterable, Iterator, List, Dict, Any, Optional, Tuple, Union
 from .constants import (
     TABLE_MARKER, META_SEPARATOR,
     MAX_DOCUMENT_SIZE, MAX_LINE_LENGTH, MAX_ARRAY_LENGTH, MAX_OBJECT_KEYS, MAX_NESTING_DEPTH
@@ -15,6 +18,449 @@ from .exceptions import ZonDecodeError
 from ..schema.inference import TypeInferrer
 from .utils import parse_value
 
+# Rewrites inline ZON node syntax into JSON: quoted strings pass through
+# untouched, bare T/F become true/false and identifier keys are quoted. The
+# colon-less ``key{...}`` / ``key[...]`` nesting form is only rewritten when
+# the key directly follows ``{`` or ``,`` and the bracket directly follows
+# the key; the generic parser does not accept it with whitespace around.
+_ZON_TO_JSON_RE = re.compile(
+    r'("(?:[^"\\]|\\.)*")'
+    r'|(?<![A-Za-z0-9_])(T|F)(?![A-Za-z0-9_])'
+    r'|([A-Za-z_]\w*)(\s*:)'
+    r'|(?<=[{,])([A-Za-z_]\w*)(?=[{\[])'
+)
+
+# Keys that parse_value would not keep as strings; left unquoted so the
+# JSON fast path rejects them and the generic parser handles them.
+_NON_STRING_KEYS = frozenset(('t', 'f', 'true', 'false', 'null', 'none', 'nil'))
+
+
+def _zon_to_json_sub(match: re.Match) -> str:
+    """Substitution callback for ``_ZON_TO_JSON_RE``."""
+    quoted, flag, key, colon, nested_key = match.group(1, 2, 3, 4, 5)
+    if quoted is not None:
+        return quoted
+    if flag is not None:
+        return 'true' if flag == 'T' else 'false'
+    if key is None:
+        key, colon = nested_key, ':'
+    if key.lower() in _NON_STRING_KEYS:
+        return match.group(0)
+    return '"' + key + '"' + colon
+
+
+# Classifies a document line: group 1 is set for table headers, otherwise
+# group 2 is a metadata key free of quotes, brackets and escapes, so the
+# separator right after it is the one _find_delimiter would report.
+_LINE_RE = re.compile(
+    '(' + re.escape(TABLE_MARKER) + ')'
+    r'|([^"\'{}\[\]\\' + re.escape(META_SEPARATOR) + ']*)' + re.escape(META_SEPARATOR)
+)
+
+# Dictionary definition key, e.g. ``status[3]``.
+_DICT_DEF_RE = re.compile(r'^(.+)\[(\d+)\]$')
+
+# Key directly followed by an inline object or array, e.g. ``config{...}``.
+_NODE_KEY_RE = re.compile(r'^([a-zA-Z0-9_\-\.]+)(\{|\[)')
+
+# Key of a sparse ``key:value`` cell trailing a table row.
+_SPARSE_KEY_RE = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
+
+# ISO date-time or clock-time prefix, whose colons are not sparse separators.
+_TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}|\d{2}:\d{2}:\d{2}')
+
+# Maximum number of table rows read and tokenized together.
+_ROW_BLOCK_SIZE = 4096
+
+# Marks row cells that decode to an implicit null and are left out of the row.
+_OMITTED = object()
+
+# Exact value types whose delta column can be summed without per-cell checks.
+_NUMERIC_TYPES = frozenset((int, float))
+
+# Characters that make _split_by_delimiter differ from a plain str.split.
+_ROW_SPECIAL_RE = re.compile(r'["\\\[\]{}]')
+_ROW_NESTING_RE = re.compile(r'[\\\[\]{}]')
+
+
+def _is_word(text: str) -> bool:
+    """Check that text is a non-empty run of word characters (regex ``\\w+``)."""
+    return text.replace('_', 'a').isalnum()
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Yield the lines of text, like ``text.split('\\n')`` without the list."""
+    find = text.find
+    start = 0
+    while True:
+        end = find('\n', start)
+        if end == -1:
+            yield text[start:]
+            return
+        yield text[start:end]
+        start = end + 1
+
+
+def _iter_file_lines(fp: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    """Yield the lines of a text or binary file, decoding bytes as UTF-8.
+    
+    Lines keep their line ending. A final empty line is yielded after a
+    trailing newline so the result matches splitting the whole text on
+    ``'\\n'``. The document size limit is enforced as lines are read.
+    
+    Args:
+        fp: File object (or any iterable of lines)
+        
+    Raises:
+        ZonDecodeError: If the document exceeds MAX_DOCUMENT_SIZE
+    """
+    size = 0
+    line = ''
+    for line in fp:
+        if not isinstance(line, str):
+            line = str(line, 'utf-8')
+        size += len(line)
+        if size > MAX_DOCUMENT_SIZE:
+            raise ZonDecodeError(
+                f"Document size exceeds maximum ({MAX_DOCUMENT_SIZE} bytes)",
+                code='E301'
+            )
+        yield line
+    if line.endswith('\n'):
+        yield ''
+
+
+@lru_cache(maxsize=4096)
+def _compile_key_path(key: str) -> Optional[Tuple[Tuple[Tuple[str, Optional[int]], ...], Optional[str]]]:
+    """Compile a dotted key into the steps _unflatten walks for it.
+    
+    Table rows repeat the same dotted column names, so each key is split
+    and classified once and the compiled path is reused for every row.
+    
+    Args:
+        key: Dot-notation key
+        
+    Returns:
+        Tuple of (steps, final_key), where each step is a (name, index) pair
+        with index None for a nested dict and final_key is None when the
+        key ends on an array index; None if the key must be skipped
+    """
+    parts = key.split('.')
+    if any(p in ('__proto__', 'constructor', 'prototype') for p in parts):
+        return None
+
+    steps: List[Tuple[str, Optional[int]]] = []
+    n = len(parts)
+    i = 0
+    while i < n - 1:
+        if parts[i + 1].isdigit():
+            steps.append((parts[i], int(parts[i + 1])))
+            i += 2
+        else:
+            steps.append((parts[i], None))
+            i += 1
+
+    final_key = parts[-1] if i == n - 1 and not parts[-1].isdigit() else None
+    return tuple(steps), final_key
+
+
+def _reject_constant(name: str) -> Any:
+    """Refuse NaN/Infinity literals, which parse_value keeps as strings."""
+    raise ValueError(name)
+
+
+def _parse_zon_node_json(text: str, depth: int) -> Tuple[bool, Any]:
+    """Try to parse an inline ZON object/array with the C JSON scanner.
+    
+    Only used when the node cannot exceed the nesting, array length or
+    object key limits, so the generic parser's limit checks stay authoritative.
+    
+    Args:
+        text: Stripped node text starting with '{' or '['
+        depth: Current nesting depth
+        
+    Returns:
+        Tuple of (ok, value); ok is False when the node is not plain JSON
+        after rewriting and the generic parser must handle it
+    """
+    if text.count('{') + text.count('[') > MAX_NESTING_DEPTH - depth:
+        return False, None
+    if text.count(',') >= min(MAX_OBJECT_KEYS, MAX_ARRAY_LENGTH):
+        return False, None
+    try:
+        return True, json.loads(
+            _ZON_TO_JSON_RE.sub(_zon_to_json_sub, text),
+            parse_constant=_reject_constant
+        )
+    except ValueError:
+        return False, None
+
+
+def _is_url(s: str) -> bool:
+    """Check if string looks like a URL."""
+    return s.startswith('http://') or s.startswith('https://') or s.startswith('/')
+
+
+def _is_timestamp(s: str) -> bool:
+    """Check if string looks like a timestamp."""
+    return _TIMESTAMP_RE.match(s) is not None
+
+
+def _parse_zon_node(text: str, depth: int = 0) -> Any:
+    """Parse a ZON node (object, array, or primitive).
+    
+    Args:
+        text: String to parse
+        depth: Current nesting depth
+        
+    Returns:
+        Parsed Python object
+        
+    Raises:
+        ZonDecodeError: If nesting depth or size limits exceeded
+    """
+    if depth > MAX_NESTING_DEPTH:
+        raise ZonDecodeError(f'Maximum nesting depth exceeded ({MAX_NESTING_DEPTH})')
+
+    trimmed = text.strip()
+    if not trimmed:
+        return None
+
+    first = trimmed[0]
+    if first == '{' or first == '[':
+        ok, value = _parse_zon_node_json(trimmed, depth)
+        if ok:
+            return value
+
+    if trimmed.startswith('{') and trimmed.endswith('}'):
+        content = trimmed[1:-1].strip()
+        if not content:
+            return {}
+
+        obj: Dict[str, Any] = {}
+        pairs = _split_by_delimiter(content, ',')
+
+        if len(pairs) > MAX_OBJECT_KEYS:
+            raise ZonDecodeError(
+                f"Object key count exceeds maximum ({MAX_OBJECT_KEYS} keys)",
+                code='E304'
+            )
+
+        for pair in pairs:
+            match = _NODE_KEY_RE.match(pair)
+            if match:
+                key_str = match.group(1)
+                val_str = pair[match.end(1):]
+                key = parse_value(key_str)
+                val = _parse_zon_node(val_str, depth + 1)
+                obj[key] = val
+                continue
+
+            if ':' not in pair:
+                continue
+
+            colon_pos = _find_delimiter(pair, ':')
+            if colon_pos == -1:
+                continue
+
+            key_str = pair[:colon_pos].strip()
+            val_str = pair[colon_pos + 1:].strip()
+
+            key = parse_value(key_str)
+            val = _parse_zon_node(val_str, depth + 1)
+            obj[key] = val
+
+        return obj
+
+    if trimmed.startswith('[') and trimmed.endswith(']'):
+        content = trimmed[1:-1].strip()
+        if not content:
+            return []
+
+        items = _split_by_delimiter(content, ',')
+
+        if len(items) > MAX_ARRAY_LENGTH:
+            raise ZonDecodeError(
+                f"Array length exceeds maximum ({MAX_ARRAY_LENGTH} items)",
+                code='E303'
+            )
+
+        return [_parse_zon_node(item, depth + 1) for item in items]
+
+    return parse_value(trimmed)
+
+
+def _find_delimiter(text: str, delim: str) -> int:
+    """Find index of delimiter, respecting quotes and nesting.
+    
+    Args:
+        text: Text to search
+        delim: Delimiter character
+        
+    Returns:
+        Index of delimiter or -1 if not found
+    """
+    in_quote = False
+    quote_char = None
+    depth = 0
+
+    i = 0
+    while i < len(text):
+        char = text[i]
+        if char == '\\' and i + 1 < len(text):
+            i += 2
+            continue
+
+        if char in ['"', "'"]:
+            if not in_quote:
+                in_quote = True
+                quote_char = char
+            elif char == quote_char:
+                in_quote = False
+                quote_char = None
+        elif not in_quote:
+            if char in ['{', '[']:
+                depth += 1
+            elif char in ['}', ']']:
+                depth -= 1
+            elif char == delim and depth == 0:
+                return i
+        i += 1
+    return -1
+
+
+@lru_cache(maxsize=None)
+def _split_pattern(delim: str) -> re.Pattern:
+    """Compile the pattern matching every character _split_by_delimiter acts on."""
+    return re.compile('[' + re.escape('\\"{}[]' + delim) + ']')
+
+
+def _split_by_delimiter(text: str, delim: str) -> List[str]:
+    """Split text by delimiter, respecting quotes and nesting.
+    
+    Args:
+        text: Text to split
+        delim: Delimiter character
+        
+    Returns:
+        List of split parts
+    """
+    if not text:
+        return ['']
+
+    parts: List[str] = []
+    start = 0
+    in_quote = False
+    depth = 0
+    escaped = -1
+
+    for match in _split_pattern(delim).finditer(text):
+        i = match.start()
+        if i == escaped:
+            continue
+
+        char = match.group()
+        if char == '\\':
+            escaped = i + 1
+        elif char == '"':
+            in_quote = not in_quote
+        elif not in_quote:
+            if char == '{' or char == '[':
+                depth += 1
+            elif char == '}' or char == ']':
+                depth -= 1
+            elif depth == 0:
+                parts.append(text[start:i])
+                start = i + 1
+
+    parts.append(text[start:])
+
+    return parts
+
+
+def _split_quoted_row(row: str) -> List[str]:
+    """Split a table row whose only special characters are double quotes.
+    
+    Equivalent to ``_split_by_delimiter(row, ',')`` for rows without
+    escapes or nesting: splitting on quotes first leaves the quoted
+    sections at odd positions, and only the even ones can hold cell
+    boundaries.
+    
+    Args:
+        row: Row string without backslashes, braces or brackets
+        
+    Returns:
+        List of cell tokens, quotes included
+    """
+    segments = row.split('"')
+    parts = segments[0].split(',')
+    for index in range(1, len(segments)):
+        if index % 2:
+            parts[-1] += '"' + segments[index]
+        else:
+            pieces = segments[index].split(',')
+            parts[-1] += '"' + pieces[0]
+            if len(pieces) > 1:
+                parts.extend(pieces[1:])
+    return parts
+
+
+def _unflatten(d: Dict) -> Dict:
+    """Expand dot-notation keys into nested dictionaries/lists.
+    
+    Args:
+        d: Dictionary with potentially flat keys
+        
+    Returns:
+        Nested dictionary structure; d itself when it has no dotted keys
+    """
+    if '.' not in ''.join(d):
+        return d
+    return _unflatten_items(d.items())
+
+
+def _unflatten_items(items: Iterable[Tuple[str, Any]]) -> Dict:
+    """Build a nested dictionary from (dot-notation key, value) pairs.
+    
+    Args:
+        items: Key/value pairs in insertion order
+        
+    Returns:
+        Nested dictionary structure
+    """
+    result: Any = {}
+
+    for key, value in items:
+        if '.' not in key:
+            result[key] = value
+            continue
+
+        path = _compile_key_path(key)
+        if path is None:
+            continue
+
+        steps, final_key = path
+        target: Any = result
+        for name, idx in steps:
+            if idx is None:
+                target = target.setdefault(name, {})
+            else:
+                array = target.setdefault(name, [])
+                if not isinstance(array, list):
+                    break
+                while len(array) <= idx:
+                    array.append({})
+                target = array[idx]
+
+            if not isinstance(target, dict):
+                break
+        else:
+            if final_key is not None:
+                target[final_key] = value
+
+    return result
+
+
 class ZonDecoder:
     """Decodes ZON format strings into Python data structures.
     
@@ -32,37 +478,68 @@ class ZonDecoder:
         self.strict = strict
         self.type_coercion = type_coercion
         self.current_line = 0
+        self.check_line_lengths = True
         self.type_inferrer = TypeInferrer()
 
-    def decode(self, zon_str: str, **kwargs) -> Any:
+    def decode(self, zon_str: Union[str, bytes, bytearray, memoryview], **kwargs) -> Any:
         """Decode a ZON string into a Python object.
         
         Args:
-            zon_str: The ZON string to decode
+            zon_str: The ZON string to decode, or its UTF-8 encoded bytes
+            **kwargs: Optional overrides for strict and type_coercion
+            
+        Returns:
+            Decoded Python object (dict, list, or primitive)
+        """
+        if isinstance(zon_str, (bytes, bytearray, memoryview)):
+            zon_str = str(zon_str, 'utf-8')
+
+        return self._decode_with_options(self._decode_internal, zon_str, kwargs)
+
+    def decode_file(self, fp: Iterable[Union[str, bytes]], **kwargs) -> Any:
+        """Decode a ZON document read line by line from a file object.
+        
+        Produces the same result as ``decode(fp.read())`` without holding
+        the whole document text in memory: each line is released once it
+        has been parsed.
+        
+        Args:
+            fp: File opened in text or binary mode (binary is read as
+                UTF-8), or any iterable of lines
             **kwargs: Optional overrides for strict and type_coercion
             
         Returns:
             Decoded Python object (dict, list, or primitive)
         """
-        strict = kwargs.get('strict', self.strict)
-        type_coercion = kwargs.get('type_coercion', self.type_coercion)
+        return self._decode_with_options(self._decode_file_internal, fp, kwargs)
+
+    def _decode_with_options(self, decode_fn: Callable[[Any], Any], source: Any, options: Dict) -> Any:
+        """Run a decode function with per-call strict/type_coercion overrides.
         
+        Args:
+            decode_fn: Internal decode function to run on the source
+            source: Document source passed to decode_fn
+            options: Keyword overrides given to the public method
+            
+        Returns:
+            Result of decode_fn
+        """
         original_strict = self.strict
         original_type_coercion = self.type_coercion
         
-        if 'strict' in kwargs:
-            self.strict = strict
-        if 'type_coercion' in kwargs:
-            self.type_coercion = type_coercion
-            
+        if 'strict' in options:
+            self.strict = options['strict']
+        if 'type_coercion' in options:
+            self.type_coercion = options['type_coercion']
+
         try:
-            return self._decode_internal(zon_str)
+            return decode_fn(source)
         finally:
             self.strict = original_strict
             self.type_coercion = original_type_coercion
 
     def _decode_internal(self, zon_str: str) -> Any:
-        """Internal decoding logic handling line-by-line parsing.
+        """Internal decoding logic for a complete ZON string.
         
         Args:
             zon_str: ZON string to decode
@@ -82,88 +559,113 @@ class ZonDecoder:
                 code='E301'
             )
 
-        lines = zon_str.split('\n')
-        if not lines:
+        if '\n' not in zon_str and zon_str.strip().startswith('['):
+            return _parse_zon_node(zon_str)
+
+        # No line of a document shorter than the limit can exceed it.
+        self.check_line_lengths = len(zon_str) > MAX_LINE_LENGTH
+        return self._decode_lines(_iter_lines(zon_str))
+
+    def _decode_file_internal(self, fp: Iterable[Union[str, bytes]]) -> Any:
+        """Internal decoding logic for a document read from a file.
+        
+        Args:
+            fp: File object or iterable of lines
+            
+        Returns:
+            Decoded object
+            
+        Raises:
+            ZonDecodeError: If decoding fails or limits are exceeded
+        """
+        lines = _iter_file_lines(fp)
+        first_line = next(lines, None)
+        if first_line is None:
             return {}
+        if not first_line.endswith('\n'):
+            # A single-line document: decode it exactly like a string.
+            return self._decode_internal(first_line)
 
-        if len(lines) == 1 and lines[0].strip().startswith('['):
-            return self._parse_zon_node(lines[0])
+        self.check_line_lengths = True
+        return self._decode_lines(chain((first_line,), lines))
 
+    def _decode_lines(self, line_iter: Iterator[str]) -> Any:
+        """Line-by-line parsing shared by string and file decoding.
+        
+        Args:
+            line_iter: Iterator over the document's lines
+            
+        Returns:
+            Decoded object
+            
+        Raises:
+            ZonDecodeError: If decoding fails or limits are exceeded
+        """
         metadata: Dict[str, Any] = {}
         tables: Dict[str, Dict] = {}
-        current_table: Optional[Dict] = None
-        current_table_name: Optional[str] = None
         pending_dictionaries: Dict[str, List[str]] = {}
 
-        for line_idx, line in enumerate(lines):
-            self.current_line = line_idx + 1
-            trimmed_line = line.rstrip()
+        pending_line: Optional[str] = None
+        self.current_line = 0
 
-            if len(trimmed_line) > MAX_LINE_LENGTH:
-                raise ZonDecodeError(
-                    f"Line length exceeds maximum ({MAX_LINE_LENGTH} chars)",
-                    code='E302',
-                    line=self.current_line
-                )
+        while True:
+            if pending_line is not None:
+                trimmed_line, pending_line = pending_line, None
+            else:
+                line = next(line_iter, None)
+                if line is None:
+                    break
+                self.current_line += 1
+                trimmed_line = line.rstrip()
+                if self.check_line_lengths:
+                    self._check_line_length(trimmed_line)
 
             if not trimmed_line:
-                if current_table is not None and current_table['row_index'] < current_table['expected_rows']:
-                    pass
-                else:
-                    continue
+                continue
 
-            if trimmed_line.startswith(TABLE_MARKER):
-                current_table_name, current_table = self._parse_table_header(trimmed_line)
-                current_table['dictionaries'] = pending_dictionaries.copy()
+            line_match = _LINE_RE.match(trimmed_line)
+            if line_match is None:
+                sep_index = _find_delimiter(trimmed_line, META_SEPARATOR)
+            elif line_match.group(1):
+                table_name, table = self._parse_table_header(trimmed_line)
+                table['dictionaries'] = pending_dictionaries.copy()
                 pending_dictionaries = {}
-                tables[current_table_name] = current_table
+                tables[table_name] = table
+                pending_line = self._parse_table_rows(line_iter, table)
                 continue
+            else:
+                sep_index = line_match.end(2)
+
+            if sep_index != -1:
+                key = trimmed_line[:sep_index].strip()
+                val = trimmed_line[sep_index + 1:].strip()
+
+                dict_match = _DICT_DEF_RE.match(key)
+                if dict_match:
+                    col = dict_match.group(1)
+                    vals = _split_by_delimiter(val, ',')
+                    parsed_vals = [str(parse_value(v)) for v in vals]
+                    pending_dictionaries[col] = parsed_vals
+                    continue
 
-            processed_as_row = False
-            if current_table is not None and current_table['row_index'] < current_table['expected_rows']:
-                row = self._parse_table_row(trimmed_line, current_table)
-                current_table['rows'].append(row)
-
-                if current_table['row_index'] >= current_table['expected_rows']:
-                    current_table = None
-                processed_as_row = True
-
-            if not processed_as_row:
-                sep_index = self._find_delimiter(trimmed_line, META_SEPARATOR)
-                if sep_index != -1:
-                    key = trimmed_line[:sep_index].strip()
-                    val = trimmed_line[sep_index + 1:].strip()
-
-                    dict_match = re.match(r'^(.+)\[(\d+)\]$', key)
-                    if dict_match:
-                        col = dict_match.group(1)
-                        vals = self._split_by_delimiter(val, ',')
-                        parsed_vals = [str(parse_value(v)) for v in vals]
-                        pending_dictionaries[col] = parsed_vals
-                        continue
+                if val.startswith(TABLE_MARKER):
+                    _, table = self._parse_table_header(val)
+                    table['dictionaries'] = pending_dictionaries.copy()
+                    pending_dictionaries = {}
+                    tables[key] = table
+                    pending_line = self._parse_table_rows(line_iter, table)
+                elif val.startswith('{') or val.startswith('['):
+                    metadata[key] = _parse_zon_node(val)
+                else:
+                    metadata[key] = parse_value(val)
 
-                    if val.startswith(TABLE_MARKER):
-                        _, table_info = self._parse_table_header(val)
-                        current_table_name = key
-                        current_table = table_info
-                        current_table['dictionaries'] = pending_dictionaries.copy()
-                        pending_dictionaries = {}
-                        tables[current_table_name] = current_table
-                    else:
-                        current_table = None
-                        
-                        if val.startswith('{') or val.startswith('['):
-                             metadata[key] = self._parse_zon_node(val)
-                        else:
-                             metadata[key] = parse_value(val)
-                
-                elif trimmed_line.endswith('}') or trimmed_line.endswith(']'):
-                     match = re.match(r'^([a-zA-Z0-9_\-\.]+)(\{|\[)', trimmed_line)
-                     if match:
-                         key = match.group(1)
-                         val_start = match.start(2)
-                         val = trimmed_line[val_start:]
-                         metadata[key] = self._parse_zon_node(val)
+            elif trimmed_line.endswith('}') or trimmed_line.endswith(']'):
+                match = _NODE_KEY_RE.match(trimmed_line)
+                if match:
+                    key = match.group(1)
+                    val_start = match.start(2)
+                    val = trimmed_line[val_start:]
+                    metadata[key] = _parse_zon_node(val)
 
         for table_name, table in tables.items():
             if self.strict and len(table['rows']) != table['expected_rows']:
@@ -173,20 +675,37 @@ class ZonDecoder:
                     context=f"Table: {table_name}"
                 )
 
-            metadata[table_name] = self._reconstruct_table(table)
+            metadata[table_name] = table['rows']
 
-        result = self._unflatten(metadata)
+        result = _unflatten(metadata)
 
         if len(result) == 1 and 'data' in result and isinstance(result['data'], list):
             return result['data']
 
         return result
 
+    def _check_line_length(self, line: str) -> None:
+        """Raise if a line exceeds the maximum allowed length.
+        
+        Args:
+            line: Line to check
+            
+        Raises:
+            ZonDecodeError: If the line is longer than MAX_LINE_LENGTH
+        """
+        if len(line) > MAX_LINE_LENGTH:
+            raise ZonDecodeError(
+                f"Line length exceeds maximum ({MAX_LINE_LENGTH} chars)",
+                code='E302',
+                line=self.current_line
+            )
+
     def _parse_table_header(self, line: str) -> Tuple[str, Dict]:
         """Parse a table header line.
         
-        Supports various header formats including named tables, anonymous tables,
-        and legacy formats.
+        Supports named tables ``@name(N)``, value tables ``@(N)`` and anonymous
+        tables ``@N``, each optionally followed by omitted columns ``[col]``
+        and then ``:`` and the column list.
         
         Args:
             line: Header line string
@@ -197,71 +716,62 @@ class ZonDecoder:
         Raises:
             ZonDecodeError: If header format is invalid
         """
-        v2_named_pattern = r'^@(\w+)\((\d+)\)(\[\w+\])*:(.*)$'
-        v2_named_match = re.match(v2_named_pattern, line)
-
-        if v2_named_match:
-            table_name = v2_named_match.group(1)
-            count = int(v2_named_match.group(2))
-            omitted_str = v2_named_match.group(3) or ''
-            cols_str = v2_named_match.group(4)
-            return table_name, self._create_table_info(count, omitted_str, cols_str)
-
-        v2_value_pattern = r'^@\((\d+)\)(\[\w+\])*:(.*)$'
-        v2_value_match = re.match(v2_value_pattern, line)
-
-        if v2_value_match:
-            count = int(v2_value_match.group(1))
-            omitted_str = v2_value_match.group(2) or ''
-            cols_str = v2_value_match.group(3)
-            return 'data', self._create_table_info(count, omitted_str, cols_str)
-
-        v2_pattern = r'^@(\d+)(\[\w+\])*:(.*)$'
-        v2_match = re.match(v2_pattern, line)
-
-        if v2_match:
-            count = int(v2_match.group(1))
-            omitted_str = v2_match.group(2) or ''
-            cols_str = v2_match.group(3)
-            return 'data', self._create_table_info(count, omitted_str, cols_str)
-
-        v1_pattern = r'^@(\w+)\((\d+)\):(.*)$'
-        v1_match = re.match(v1_pattern, line)
-
-        if v1_match:
-            table_name = v1_match.group(1)
-            count = int(v1_match.group(2))
-            cols_str = v1_match.group(3)
-            return table_name, self._create_table_info(count, '', cols_str)
+        body = line[len(TABLE_MARKER):]
+        parsed = None
+
+        if body.startswith('('):
+            count_str, closed, rest = body[1:].partition(')')
+            if closed and count_str.isdecimal():
+                parsed = 'data', count_str, rest
+        else:
+            name, opened, rest = body.partition('(')
+            if opened and _is_word(name):
+                count_str, closed, rest = rest.partition(')')
+                if closed and count_str.isdecimal():
+                    parsed = name, count_str, rest
+            else:
+                digits = 0
+                while digits < len(body) and body[digits].isdecimal():
+                    digits += 1
+                if digits:
+                    parsed = 'data', body[:digits], body[digits:]
+
+        if parsed is not None:
+            table_name, count_str, rest = parsed
+            omitted_cols: List[str] = []
+            while rest.startswith('['):
+                col, closed, rest = rest[1:].partition(']')
+                if not closed or not _is_word(col):
+                    break
+                omitted_cols.append(col)
+            else:
+                if rest.startswith(META_SEPARATOR):
+                    cols_str = rest[len(META_SEPARATOR):]
+                    return table_name, self._create_table_info(int(count_str), omitted_cols, cols_str)
 
         raise ZonDecodeError(f"Invalid table header: {line}")
 
-    def _create_table_info(self, count: int, omitted_str: str, cols_str: str) -> Dict:
+    def _create_table_info(self, count: int, omitted_cols: List[str], cols_str: str) -> Dict:
         """Create a dictionary holding table state and metadata.
         
         Args:
             count: Expected row count
-            omitted_str: String containing omitted column definitions
+            omitted_cols: Names of omitted (implicit row number) columns
             cols_str: String containing column definitions
             
         Returns:
             Table info dictionary
         """
-        omitted_cols = []
-        if omitted_str:
-            for m in re.finditer(r'\[(\w+)\]', omitted_str):
-                omitted_cols.append(m.group(1))
-
         if not cols_str:
             raw_cols = []
         else:
-            raw_cols = [c.strip() for c in cols_str.split(',')]
+            raw_cols = [sys.intern(c.strip()) for c in cols_str.split(',')]
         cols = []
         delta_cols = set()
 
         for rc in raw_cols:
             if rc.endswith(':delta'):
-                col_name = rc[:-6]
+                col_name = sys.intern(rc[:-6])
                 delta_cols.add(col_name)
                 cols.append(col_name)
             else:
@@ -271,323 +781,320 @@ class ZonDecoder:
             'cols': cols,
             'omitted_cols': omitted_cols,
             'rows': [],
-            'prev_vals': {col: None for col in cols},
+            'prev_vals': [None] * len(cols),
             'row_index': 0,
             'expected_rows': count,
             'delta_cols': delta_cols,
             'dictionaries': {}
         }
 
-    def _parse_table_row(self, line: str, table: Dict) -> Dict:
-        """Parse a single table row.
+    def _plan_columns(self, table: Dict) -> None:
+        """Resolve how each column of a table is decoded.
         
-        Handles standard values, delta encoding, dictionary lookups, and sparse fields.
+        Runs once the table's dictionaries are known, so the row parsers
+        read a per-position plan instead of testing every cell's column
+        against the delta and dictionary definitions. Dictionary entries
+        are parsed here once rather than on every lookup.
         
         Args:
-            line: Row string
-            table: Table info dictionary
-            
-        Returns:
-            Parsed row dictionary
-            
-        Raises:
-            ZonDecodeError: If field count mismatch in strict mode
+            table: Table info dictionary; gains 'col_plan', a list of
+                (is_delta, lookup) pairs aligned with 'cols',
+                'unique_cols' and 'nested' (whether any column is a dotted
+                path that rows must be expanded along)
         """
-        tokens = self._split_by_delimiter(line, ',')
-        
-        core_field_count = len(tokens)
-        
-        if self.strict and core_field_count < len(table['cols']):
-             raise ZonDecodeError(
-                f"Field count mismatch on row {table['row_index'] + 1}: expected {len(table['cols'])} fields, got {core_field_count}",
-                code='E002',
-                line=self.current_line,
-                context=line[:50] + ('...' if len(line) > 50 else '')
-            )
-
-        while len(tokens) < len(table['cols']):
-            tokens.append('')
-
-        row: Dict[str, Any] = {}
-        token_idx = 0
+        delta_cols = table['delta_cols']
+        dictionaries = table['dictionaries']
+        plan: List[Tuple[bool, Optional[List[Any]]]] = []
 
         for col in table['cols']:
-            if token_idx < len(tokens):
-                tok = tokens[token_idx]
-                
-                if col in table['delta_cols']:
-                    val = parse_value(tok)
-                    if table['row_index'] > 0:
-                        prev = table['prev_vals'][col]
-                        if isinstance(val, (int, float)) and isinstance(prev, (int, float)):
-                            val = prev + val
-                    table['prev_vals'][col] = val
-                    if val is not None or tok.strip().lower() == 'null':
-                        row[col] = val
-                else:
-                    if col in table['dictionaries']:
-                        val = parse_value(tok)
-                        if isinstance(val, int) and 0 <= val < len(table['dictionaries'][col]):
-                            v = parse_value(table['dictionaries'][col][val])
-                            row[col] = v
-                        else:
-                            v = self._parse_zon_node(tok)
-                            if v is not None or tok.strip().lower() == 'null':
-                                row[col] = v
-                    else:
-                        v = self._parse_zon_node(tok)
-                        if v is not None or tok.strip().lower() == 'null':
-                            row[col] = v
-                
-                token_idx += 1
-
-        while token_idx < len(tokens):
-            tok = tokens[token_idx]
-            if ':' in tok and not self._is_url(tok) and not self._is_timestamp(tok):
-                colon_idx = tok.index(':')
-                key = tok[:colon_idx].strip()
-                val = tok[colon_idx + 1:].strip()
-                if re.match(r'^[a-zA-Z0-9_\-\.]+$', key):
-                    row[key] = self._parse_zon_node(val)
-            token_idx += 1
-
-        if table['omitted_cols']:
-            for col in table['omitted_cols']:
-                row[col] = table['row_index'] + 1
-
-        table['row_index'] += 1
-        return row
-
-    def _is_url(self, s: str) -> bool:
-        """Check if string looks like a URL."""
-        return s.startswith('http://') or s.startswith('https://') or s.startswith('/')
-
-    def _is_timestamp(self, s: str) -> bool:
-        """Check if string looks like a timestamp."""
-        return bool(re.match(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}', s)) or bool(re.match(r'^\d{2}:\d{2}:\d{2}', s))
+            if col in delta_cols:
+                plan.append((True, None))
+            elif col in dictionaries:
+                plan.append((False, [parse_value(v) for v in dictionaries[col]]))
+            else:
+                plan.append((False, None))
 
-    def _reconstruct_table(self, table: Dict) -> List[Dict]:
-        """Reconstruct full table from table info and rows."""
-        return [self._unflatten(row) for row in table['rows']]
+        table['col_plan'] = plan
+        table['unique_cols'] = len(set(table['cols'])) == len(table['cols'])
+        table['nested'] = any('.' in col for col in chain(table['cols'], table['omitted_cols']))
 
-    def _parse_zon_node(self, text: str, depth: int = 0) -> Any:
-        """Parse a ZON node (object, array, or primitive).
+    def _parse_table_rows(self, line_iter: Iterator[str], table: Dict) -> Optional[str]:
+        """Parse the row lines that follow a table header.
+        
+        A table owns the next ``expected_rows`` lines, blank lines included,
+        unless a line starting a new table cuts it short. Rows are read in
+        blocks of at most _ROW_BLOCK_SIZE lines; each block is tokenized up
+        front and then decoded, so only one block of raw lines is alive at
+        a time.
         
         Args:
-            text: String to parse
-            depth: Current nesting depth
+            line_iter: Iterator positioned on the first line after the header
+            table: Table info dictionary
             
         Returns:
-            Parsed Python object
-            
-        Raises:
-            ZonDecodeError: If nesting depth or size limits exceeded
+            The line that cut the table short (already stripped), or None
         """
-        if depth > MAX_NESTING_DEPTH:
-            raise ZonDecodeError(f'Maximum nesting depth exceeded ({MAX_NESTING_DEPTH})')
-
-        trimmed = text.strip()
-        if not trimmed:
-            return None
-
-        if trimmed.startswith('{') and trimmed.endswith('}'):
-            content = trimmed[1:-1].strip()
-            if not content:
-                return {}
-
-            obj: Dict[str, Any] = {}
-            pairs = self._split_by_delimiter(content, ',')
-
-            if len(pairs) > MAX_OBJECT_KEYS:
-                raise ZonDecodeError(
-                    f"Object key count exceeds maximum ({MAX_OBJECT_KEYS} keys)",
-                    code='E304'
-                )
-
-            for pair in pairs:
-                match = re.match(r'^([a-zA-Z0-9_\-\.]+)(\{|\[)', pair)
-                if match:
-                    key_str = match.group(1)
-                    val_str = pair[match.end(1):]
-                    key = parse_value(key_str)
-                    val = self._parse_zon_node(val_str, depth + 1)
-                    obj[key] = val
-                    continue
-
-                if ':' not in pair:
-                    continue
-
-                colon_pos = self._find_delimiter(pair, ':')
-                if colon_pos == -1:
-                    continue
-
-                key_str = pair[:colon_pos].strip()
-                val_str = pair[colon_pos + 1:].strip()
-
-                key = parse_value(key_str)
-                val = self._parse_zon_node(val_str, depth + 1)
-                obj[key] = val
+        self._plan_columns(table)
+        remaining = table['expected_rows'] - table['row_index']
+        check_length = self.check_line_lengths
+
+        while remaining > 0:
+            first_line = self.current_line + 1
+            block_size = min(remaining, _ROW_BLOCK_SIZE)
+            block: List[str] = []
+            cut_line: Optional[str] = None
+            line_number = self.current_line
+
+            for row_line in islice(line_iter, block_size):
+                line_number += 1
+                row_line = row_line.rstrip()
+                if check_length:
+                    self.current_line = line_number
+                    self._check_line_length(row_line)
+                if row_line.startswith(TABLE_MARKER):
+                    cut_line = row_line
+                    break
+                block.append(row_line)
 
-            return obj
+            last_line = self.current_line = line_number
+            self._parse_row_block(block, first_line, table)
+            self.current_line = last_line
 
-        if trimmed.startswith('[') and trimmed.endswith(']'):
-            content = trimmed[1:-1].strip()
-            if not content:
-                return []
+            if cut_line is not None or len(block) < block_size:
+                return cut_line
+            remaining -= block_size
 
-            items = self._split_by_delimiter(content, ',')
+        return None
 
-            if len(items) > MAX_ARRAY_LENGTH:
-                raise ZonDecodeError(
-                    f"Array length exceeds maximum ({MAX_ARRAY_LENGTH} items)",
-                    code='E303'
-                )
+    def _parse_row_block(self, block: List[str], first_line: int, table: Dict) -> None:
+        """Decode a block of row lines into the table's rows.
+        
+        Args:
+            block: Stripped row lines
+            first_line: Line number of the first row in the block
+            table: Table info dictionary
+        """
+        token_rows, scalar_only = self._tokenize_rows(block)
 
-            return [self._parse_zon_node(item, depth + 1) for item in items]
+        if scalar_only:
+            rows = self._parse_scalar_rows(token_rows, table)
+            if rows is not None:
+                table['rows'].extend(rows)
+                return
 
-        return parse_value(trimmed)
+        for offset, tokens in enumerate(token_rows):
+            self.current_line = first_line + offset
+            table['rows'].append(self._parse_table_row(block[offset], tokens, table))
 
-    def _find_delimiter(self, text: str, delim: str) -> int:
-        """Find index of delimiter, respecting quotes and nesting.
+    def _tokenize_rows(self, rows: List[str]) -> Tuple[List[List[str]], bool]:
+        """Split a block of table rows into cell tokens.
+        
+        When the block contains no quotes, escapes or nested values, every
+        row is split with a plain ``str.split``. Otherwise rows that only
+        add quotes use _split_quoted_row, and just the rows with escapes
+        or nesting go through the full quote and nesting aware splitter.
         
         Args:
-            text: Text to search
-            delim: Delimiter character
+            rows: Row strings of one table
             
         Returns:
-            Index of delimiter or -1 if not found
+            Tuple of (token lists one per row, whether every cell is a
+            scalar token rather than an inline object or array)
         """
-        in_quote = False
-        quote_char = None
-        depth = 0
-
-        i = 0
-        while i < len(text):
-            char = text[i]
-            if char == '\\' and i + 1 < len(text):
-                i += 2
+        search = _ROW_SPECIAL_RE.search
+        if not search('\n'.join(rows)):
+            return [row.split(',') for row in rows], True
+
+        has_nesting = _ROW_NESTING_RE.search
+        token_rows: List[List[str]] = []
+        scalar_only = True
+        for row in rows:
+            if not search(row):
+                token_rows.append(row.split(','))
                 continue
-
-            if char in ['"', "'"]:
-                if not in_quote:
-                    in_quote = True
-                    quote_char = char
-                elif char == quote_char:
-                    in_quote = False
-                    quote_char = None
-            elif not in_quote:
-                if char in ['{', '[']:
-                    depth += 1
-                elif char in ['}', ']']:
-                    depth -= 1
-                elif char == delim and depth == 0:
-                    return i
-            i += 1
-        return -1
-
-    def _split_by_delimiter(self, text: str, delim: str) -> List[str]:
-        """Split text by delimiter, respecting quotes and nesting.
+            if not has_nesting(row):
+                token_rows.append(_split_quoted_row(row))
+                continue
+            tokens = _split_by_delimiter(row, ',')
+            if scalar_only and ('{' in row or '[' in row):
+                scalar_only = not any(tok.lstrip()[:1] in ('{', '[') for tok in tokens)
+            token_rows.append(tokens)
+        return token_rows, scalar_only
+
+    def _parse_scalar_rows(self, token_rows: List[List[str]], table: Dict) -> Optional[List[Dict]]:
+        """Decode a block of scalar-only rows column by column.
+        
+        Each column's tokens are converted in one bulk pass (resolving
+        delta and dictionary columns along the way) and the row dicts are
+        zipped together afterwards. Blocks with rows of a different width
+        than the header, duplicate column names or cells that the row path
+        would omit are left to _parse_table_row.
         
         Args:
-            text: Text to split
-            delim: Delimiter character
+            token_rows: Cell tokens of each row, none of them an inline
+                object or array
+            table: Table info dictionary
             
         Returns:
-            List of split parts
+            List of row dictionaries, or None if the block needs the
+            row-by-row path
         """
-        if not text:
-            return ['']
-
-        parts: List[str] = []
-        current: List[str] = []
-        in_quote = False
-        quote_char = None
-        depth = 0
-
-        i = 0
-        while i < len(text):
-            char = text[i]
-            if char == '\\' and i + 1 < len(text):
-                current.append(char)
-                current.append(text[i + 1])
-                i += 2
-                continue
+        cols = table['cols']
+        width = len(cols)
+        if not token_rows or not table['unique_cols']:
+            return None
+        for tokens in token_rows:
+            if len(tokens) != width:
+                return None
+
+        row_index = table['row_index']
+        columns: List[List[Any]] = []
+        delta_prev: Dict[int, Any] = {}
+
+        for index, ((is_delta, lookup), col_tokens) in enumerate(zip(table['col_plan'], zip(*token_rows))):
+            values = list(map(parse_value, col_tokens))
+
+            if None in values or (not is_delta and '' in values):
+                for tok, val in zip(col_tokens, values):
+                    if (val is None or (val == '' and not is_delta)) and tok.strip().lower() != 'null':
+                        return None
+
+            if is_delta:
+                prev = table['prev_vals'][index]
+                if set(map(type, values)) <= _NUMERIC_TYPES:
+                    # Every cell is a number, so the column is a running sum
+                    # continuing from the previous block's last value.
+                    if row_index == 0:
+                        values = list(accumulate(values))
+                        delta_prev[index] = values[-1]
+                        columns.append(values)
+                        continue
+                    if type(prev) in _NUMERIC_TYPES:
+                        values = list(accumulate(values, initial=prev))[1:]
+                        delta_prev[index] = values[-1]
+                        columns.append(values)
+                        continue
+                for i, val in enumerate(values):
+                    if row_index + i > 0 and isinstance(val, (int, float)) and isinstance(prev, (int, float)):
+                        val = prev + val
+                        values[i] = val
+                    prev = val
+                delta_prev[index] = prev
+            elif lookup is not None:
+                size = len(lookup)
+                values = [lookup[v] if isinstance(v, int) and 0 <= v < size else v for v in values]
+
+            columns.append(values)
+
+        if table['nested'] and not table['omitted_cols']:
+            # Write each cell straight into its nested position instead of
+            # building a flat row first.
+            rows = [_unflatten_items(zip(cols, values)) for values in zip(*columns)]
+        else:
+            rows = [dict(zip(cols, values)) for values in zip(*columns)]
 
-            if char == '"':
-                in_quote = not in_quote
-                current.append(char)
-            elif not in_quote:
-                if char in ['{', '[']:
-                    depth += 1
-                    current.append(char)
-                elif char in ['}', ']']:
-                    depth -= 1
-                    current.append(char)
-                elif char == delim and depth == 0:
-                    parts.append(''.join(current))
-                    current = []
-                else:
-                    current.append(char)
-            else:
-                current.append(char)
-            i += 1
+            if table['omitted_cols']:
+                row_number = row_index
+                for row in rows:
+                    row_number += 1
+                    for col in table['omitted_cols']:
+                        row[col] = row_number
 
-        parts.append(''.join(current))
+            if table['nested']:
+                rows = [_unflatten(row) for row in rows]
 
-        return parts
+        for index, prev in delta_prev.items():
+            table['prev_vals'][index] = prev
+        table['row_index'] += len(rows)
+        return rows
 
-    def _unflatten(self, d: Dict) -> Dict:
-        """Expand dot-notation keys into nested dictionaries/lists.
+    def _parse_table_row(self, line: str, tokens: List[str], table: Dict) -> Dict:
+        """Parse a single table row.
+        
+        Handles standard values, delta encoding, dictionary lookups, and sparse fields.
         
         Args:
-            d: Dictionary with potentially flat keys
+            line: Row string
+            tokens: Cell tokens of the row
+            table: Table info dictionary
             
         Returns:
-            Nested dictionary structure
+            Parsed row dictionary
+            
+        Raises:
+            ZonDecodeError: If field count mismatch in strict mode
         """
-        result: Any = {}
+        core_field_count = len(tokens)
+        
+        if self.strict and core_field_count < len(table['cols']):
+             raise ZonDecodeError(
+                f"Field count mismatch on row {table['row_index'] + 1}: expected {len(table['cols'])} fields, got {core_field_count}",
+                code='E002',
+                line=self.current_line,
+                context=line[:50] + ('...' if len(line) > 50 else '')
+            )
 
-        for key, value in d.items():
-            if '.' not in key:
-                result[key] = value
-                continue
+        cols = table['cols']
+        width = len(cols)
+        while len(tokens) < width:
+            tokens.append('')
 
-            parts = key.split('.')
-            if any(p in ['__proto__', 'constructor', 'prototype'] for p in parts):
-                continue
+        prev_vals = table['prev_vals']
+        row_index = table['row_index']
+        values: List[Any] = []
+        omitted = False
+
+        for index, (is_delta, lookup) in enumerate(table['col_plan']):
+            tok = tokens[index]
+            if is_delta:
+                val = parse_value(tok)
+                if row_index > 0:
+                    prev = prev_vals[index]
+                    if isinstance(val, (int, float)) and isinstance(prev, (int, float)):
+                        val = prev + val
+                prev_vals[index] = val
+            elif lookup is not None:
+                val = parse_value(tok)
+                if isinstance(val, int) and 0 <= val < len(lookup):
+                    values.append(lookup[val])
+                    continue
+                val = _parse_zon_node(tok)
+            else:
+                val = _parse_zon_node(tok)
 
-            target: Any = result
-            for i, part in enumerate(parts[:-1]):
-                next_part = parts[i + 1]
-
-                if next_part.isdigit():
-                    idx = int(next_part)
-                    if part not in target:
-                        target[part] = []
-                    while len(target[part]) <= idx:
-                        target[part].append({})
-                    target = target[part][idx]
-                    parts.pop(i + 1)
-                    break
-                else:
-                    if part not in target:
-                        target[part] = {}
-                    if isinstance(target[part], dict):
-                        target = target[part]
-                    else:
-                        break
-
-            final_key = parts[-1]
-            if not final_key.isdigit():
-                target[final_key] = value
+            if val is None and tok.strip().lower() != 'null':
+                val = _OMITTED
+                omitted = True
+            values.append(val)
 
-        return result
+        if omitted:
+            row: Dict[str, Any] = {col: val for col, val in zip(cols, values) if val is not _OMITTED}
+        else:
+            row = dict(zip(cols, values))
+
+        token_idx = width
+        while token_idx < len(tokens):
+            tok = tokens[token_idx]
+            if ':' in tok and not _is_url(tok) and not _is_timestamp(tok):
+                colon_idx = tok.index(':')
+                key = tok[:colon_idx].strip()
+                val = tok[colon_idx + 1:].strip()
+                if _SPARSE_KEY_RE.match(key):
+                    row[key] = _parse_zon_node(val)
+            token_idx += 1
+
+        if table['omitted_cols']:
+            for col in table['omitted_cols']:
+                row[col] = table['row_index'] + 1
 
-def decode(data: str, strict: bool = True, options: Dict[str, bool] = None) -> Any:
+        table['row_index'] += 1
+        return _unflatten(row)
+
+def decode(data: Union[str, bytes, bytearray, memoryview], strict: bool = True, options: Dict[str, bool] = None) -> Any:
     """Decode ZON format string (convenience function).
     
     Args:
-        data: ZON string to decode
+        data: ZON string to decode, or its UTF-8 encoded bytes
         strict: If True, enforces strict validation
         options: Optional dict with decoding options
         
@@ -596,3 +1103,18 @@ def decode(data: str, strict: bool = True, options: Dict[str, bool] = None) -> A
     """
     opts = options or {}
     return ZonDecoder(strict=strict, type_coercion=opts.get('type_coercion', False)).decode(data)
+
+
+def decode_file(fp: Iterable[Union[str, bytes]], strict: bool = True, options: Dict[str, bool] = None) -> Any:
+    """Decode a ZON document from a file object (convenience function).
+    
+    Args:
+        fp: File opened in text or binary mode, or any iterable of lines
+        strict: If True, enforces strict validation
+        options: Optional dict with decoding options
+        
+    Returns:
+        Decoded Python object
+    """
+    opts = options or {}
+    return ZonDecoder(strict=strict, type_coercion=opts.get('type_coercion', False)).decode_file(fp)
@@ -11,17 +11,120 @@ Provides encoding of Python data structures to ZON format with support for:
 import json
 import re
 import math
-from typing import List, Dict, Any, Tuple, Optional, Set, Union
+import sys
+from itertools import islice, repeat
+from operator import is_not, sub
+from typing import List, Dict, Any, Tuple, Optional, Set, FrozenSet, Union, Callable
 from .constants import (
     TABLE_MARKER, META_SEPARATOR, GAS_TOKEN, LIQUID_TOKEN, 
     DEFAULT_ANCHOR_INTERVAL
 )
 from .exceptions import ZonEncodeError
 from ..schema.inference import TypeInferrer
-from .utils import quote_string
+from .utils import json_string, quote_string
 from .types import SparseMode
 from ..llm.optimizer import LLMOptimizer
 
+
+def _format_float(val: float) -> str:
+    """Format a float without scientific notation for positive exponents.
+    
+    Args:
+        val: Float to format
+        
+    Returns:
+        Canonical float string, or "null" for NaN and infinities
+    """
+    if not math.isfinite(val):
+        return "null"
+
+    if val.is_integer():
+        return f"{int(val)}.0"
+
+    s = repr(val)
+    # repr writes the exponent marker in lowercase
+    if 'e' in s:
+        mantissa, _, exponent = s.partition('e')
+
+        if int(exponent) >= 0:
+            s = str(float(mantissa) * (10 ** int(exponent)))
+            if '.' not in s:
+                s += '.0'
+    return s
+
+
+# Magnitude from which repr switches integral floats to exponent notation
+_FLOAT_REPR_LIMIT = 1e16
+
+
+def _format_float_column(values: List[float]) -> Optional[List[str]]:
+    """Format a column of floats with repr where that matches _format_float.
+    
+    Finite floats below _FLOAT_REPR_LIMIT in magnitude repr the same way
+    _format_float writes them, apart from negative zero.
+    
+    Args:
+        values: Column of exact floats
+        
+    Returns:
+        Cell tokens in row order, or None if some value needs _format_float
+    """
+    # The sum is not finite if any value is NaN or infinite
+    if not math.isfinite(sum(values)) or min(values) <= -_FLOAT_REPR_LIMIT or max(values) >= _FLOAT_REPR_LIMIT:
+        return None
+
+    tokens = list(map(repr, values))
+    if '-0.0' in tokens:
+        tokens = ['0.0' if token == '-0.0' else token for token in tokens]
+    return tokens
+
+
+# Unquoted strings that decode as something else.
+_RESERVED_TOKENS = frozenset(('T', 'F', 'null', GAS_TOKEN, LIQUID_TOKEN))
+# Lowercased spellings the decoder reads as booleans or null, and the
+# stream markers, which _needs_type_protection always quotes.
+_KEYWORD_STRINGS = frozenset(('t', 'f', 'true', 'false', 'null', 'none', 'nil'))
+_MARKER_TOKENS = frozenset((GAS_TOKEN, LIQUID_TOKEN))
+
+# float() only accepts strings containing a digit or an inf/nan spelling.
+_FLOAT_HINT_RE = re.compile(r'\d|inf|nan', re.IGNORECASE)
+
+_INTEGER_RE = re.compile(r'^-?\d+$')
+_NUMBER_START_RE = re.compile(r'^[+-]?(\d|\.\d)')
+_QUOTE_CHARS_RE = re.compile(r'[,:}\n\r\t"\[\]|;]')
+_CONTROL_CHAR_RE = re.compile(r'[\x00-\x1f]')
+# Integers, decimals and exponent forms that a bare cell would decode as numbers
+_PROTECTED_NUMBER_RE = re.compile(r'^-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?$')
+
+# Largest dictionary _detect_dictionaries creates, and how many values it
+# hashes at a time before checking a column against that limit.
+_MAX_DICTIONARY_SIZE = 50
+_DICTIONARY_SCAN_CHUNK = 1024
+
+# Characters that force quoting of keys and string values in inline nodes
+_NODE_KEY_QUOTE_RE = re.compile(r'[,:\{\}\[\]"]')
+_NODE_STRING_QUOTE_RE = re.compile(r'[,\{\}\[\]"]')
+
+_NoneType = type(None)
+# Exact types that make a column delta-encodable without per-value checks
+_NUMERIC_TYPES = frozenset((int, float))
+# Delta columns _delta_tokens can diff without per-value type checks
+_INT_TYPES = frozenset((int,))
+# String columns _detect_dictionaries can scan without isinstance checks
+_STR_TYPES = frozenset((str,))
+_OPTIONAL_STR_TYPES = frozenset((str, _NoneType))
+
+# Formatters for exact scalar types, checked before the isinstance chain in
+# ZonEncoder._format_value (subclasses such as numpy floats fall through).
+
+_SCALAR_FORMATTERS = {
+    _NoneType: lambda val: "null",
+    bool: lambda val: "T" if val else "F",
+    int: str,
+    float: _format_float,
+}
+
+
 class ZonEncoder:
     """Encodes Python data structures to ZON format.
     
@@ -34,7 +137,9 @@ class ZonEncoder:
         self, 
         anchor_interval: int = DEFAULT_ANCHOR_INTERVAL,
         enable_dict_compression: bool = True,
-        enable_type_coercion: bool = False
+        enable_type_coercion: bool = False,
+        sort_keys: bool = True,
+        cache_schema: bool = False
     ):
         """Initialize the ZON encoder.
         
@@ -42,12 +147,23 @@ class ZonEncoder:
             anchor_interval: Interval for anchor points in streams
             enable_dict_compression: Enable dictionary compression for repeated values
             enable_type_coercion: Enable type coercion for string values
+            sort_keys: Emit metadata keys in sorted order (stable output regardless
+                of input order); when False, keys keep their insertion order
+            cache_schema: Keep flattened column names between encode calls, for
+                encoding many documents of the same shape with one encoder
+                (see reset_schema_cache)
         """
         self.anchor_interval = anchor_interval
-        self._safe_str_re = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
         self.enable_dict_compression = enable_dict_compression
         self.enable_type_coercion = enable_type_coercion
+        self.sort_keys = sort_keys
         self.type_inferrer = TypeInferrer()
+        self._key_cache: Optional[Dict[str, Dict[str, str]]] = {} if cache_schema else None
+
+    def reset_schema_cache(self) -> None:
+        """Forget the column names kept by an encoder created with cache_schema=True."""
+        if self._key_cache is not None:
+            self._key_cache.clear()
 
     def encode(self, data: Any) -> str:
         """Encode data to ZON format.
@@ -85,9 +201,13 @@ class ZonEncoder:
             output.extend(self._write_metadata(metadata))
 
         if stream_data and final_stream_key:
-            if output:
-                output.append("")
-            output.extend(self._write_table(stream_data, final_stream_key))
+            table_lines = self._write_table(stream_data, final_stream_key)
+            if not output:
+                # A table on its own is joined as returned rather than
+                # copied line by line into the output list first.
+                return "\n".join(table_lines)
+            output.append("")
+            output.extend(table_lines)
 
         return "\n".join(output)
 
@@ -141,11 +261,9 @@ class ZonEncoder:
             List of encoded metadata lines
         """
         lines: List[str] = []
-        sorted_keys = sorted(metadata.keys())
+        items = sorted(metadata.items()) if self.sort_keys else metadata.items()
         
-        for key in sorted_keys:
-            val = metadata[key]
-            
+        for key, val in items:
             if isinstance(val, (dict, list)) and val is not None:
                 val_str = self._format_zon_node(val)
                 if val_str.startswith('{') or val_str.startswith('['):
@@ -170,6 +288,12 @@ class ZonEncoder:
         if len(values) < 5:
             return SparseMode.NONE
 
+        # Plain ints and floats are settled by one pass over the value types;
+        # only columns with other types (bools, numeric subclasses) need the
+        # per-value check.
+        if set(map(type, values)) <= _NUMERIC_TYPES:
+            return SparseMode.DELTA
+
         is_numeric = True
         for val in values:
             if not isinstance(val, (int, float)) or isinstance(val, bool):
@@ -190,12 +314,35 @@ class ZonEncoder:
         Returns:
             Delta-encoded string representation
         """
-        if not values:
-            return ''
+        return "".join(self._delta_tokens(values))
+
+    def _delta_tokens(self, values: List[Union[int, float]]) -> List[str]:
+        """Encode numeric values as a first value followed by signed deltas.
         
-        deltas: List[str] = [str(values[0])]
-        for i in range(1, len(values)):
-            delta = values[i] - values[i - 1]
+        Args:
+            values: List of numeric values
+            
+        Returns:
+            One token per value: the first value, then +/- differences
+        """
+        if not values:
+            return []
+
+        prev = values[0]
+        deltas: List[str] = [str(prev)]
+
+        if set(map(type, values)) == _INT_TYPES:
+            # Integer differences need no rounding, so they are computed
+            # with one C-level map.
+            deltas.extend([
+                f"+{delta}" if delta >= 0 else str(delta)
+                for delta in map(sub, islice(values, 1, None), values)
+            ])
+            return deltas
+
+        for val in values[1:]:
+            delta = val - prev
+            prev = val
             if isinstance(delta, float):
                 delta = round(delta, 10)
                 if delta.is_integer():
@@ -203,7 +350,7 @@ class ZonEncoder:
             
             deltas.append(f"+{delta}" if delta >= 0 else str(delta))
         
-        return "".join(deltas)
+        return deltas
 
     def _write_table(self, stream: List[Dict], key: str) -> List[str]:
         """Write a table from a stream of dict objects.
@@ -222,12 +369,23 @@ class ZonEncoder:
             return []
 
         lines: List[str] = []
-        flat_stream = [self._flatten(row, '', '.', 5) for row in stream]
+        # Rows of one table (or of every table, with cache_schema) share their
+        # nested key names, so dotted column names are built once and every
+        # flat row holds the same string objects.
+        key_cache = self._key_cache if self._key_cache is not None else {}
+        # Plain dict rows without nested dicts are already flat and are used
+        # as they are (copied when type coercion will rewrite their cells).
+        copy_flat_rows = self.enable_type_coercion
+        flat_stream: List[Dict] = []
+        for row in stream:
+            if type(row) is dict and not any(map(isinstance, row.values(), repeat(dict))):
+                flat_stream.append(dict(row) if copy_flat_rows else row)
+            else:
+                flat_stream.append(self._flatten(row, '', '.', 5, 0, key_cache))
 
-        all_keys_set: Set[str] = set()
-        for d in flat_stream:
-            all_keys_set.update(d.keys())
-        cols = sorted(list(all_keys_set))
+        # set.union takes the dict rows as they are and reuses their stored
+        # key hashes, which is cheaper than feeding it one key at a time.
+        cols = sorted(set().union(*flat_stream))
 
         if self.enable_type_coercion:
             for col in cols:
@@ -239,12 +397,14 @@ class ZonEncoder:
                         if col in row and row[col] is not None:
                             row[col] = self.type_inferrer.coerce(row[col], inferred)
 
-        dictionaries = self._detect_dictionaries(flat_stream, cols) if self.enable_dict_compression else {}
+        columns = {col: [row.get(col) for row in flat_stream] for col in cols}
+
+        dictionaries = self._detect_dictionaries(columns) if self.enable_dict_compression else {}
 
         if dictionaries:
-            return self._write_dictionary_table(flat_stream, cols, dictionaries, len(stream), key)
+            return self._write_dictionary_table(flat_stream, cols, dictionaries, len(stream), key, columns)
 
-        column_stats = self._analyze_column_sparsity(flat_stream, cols)
+        column_stats = self._analyze_column_sparsity(columns)
         core_columns = [c['name'] for c in column_stats if c['presence'] >= 0.7]
         optional_columns = [c['name'] for c in column_stats if c['presence'] < 0.7]
 
@@ -252,22 +412,23 @@ class ZonEncoder:
         regular_core_columns: List[str] = []
         
         for col in core_columns:
-            values = [row.get(col) for row in flat_stream]
-            mode = self._analyze_optimal_sparse_mode(values)
+            mode = self._analyze_optimal_sparse_mode(columns[col])
             if mode == SparseMode.DELTA:
                 delta_columns.append(col)
             else:
                 regular_core_columns.append(col)
 
         if delta_columns:
-            return self._write_delta_table(flat_stream, regular_core_columns, delta_columns, optional_columns, len(stream), key)
+            return self._write_delta_table(
+                flat_stream, regular_core_columns, delta_columns, optional_columns, len(stream), key, columns
+            )
 
         use_sparse_encoding = len(optional_columns) > 0
 
         if use_sparse_encoding:
-            return self._write_sparse_table(flat_stream, core_columns, optional_columns, len(stream), key)
+            return self._write_sparse_table(flat_stream, core_columns, optional_columns, len(stream), key, columns)
         else:
-            return self._write_standard_table(flat_stream, cols, len(stream), key)
+            return self._write_standard_table(flat_stream, cols, len(stream), key, columns)
 
     def _write_delta_table(
         self,
@@ -276,7 +437,8 @@ class ZonEncoder:
         delta_cols: List[str],
         optional_cols: List[str],
         row_count: int,
-        key: str
+        key: str,
+        columns: Optional[Dict[str, List[Any]]] = None
     ) -> List[str]:
         """Write a table with delta-encoded numeric columns.
         
@@ -287,6 +449,8 @@ class ZonEncoder:
             optional_cols: Sparse/optional columns  
             row_count: Number of rows
             key: Table key/name
+            columns: Optional column values in row order (None for missing
+                cells), as built by _write_table
             
         Returns:
             List of ZON table lines with delta encoding
@@ -304,41 +468,45 @@ class ZonEncoder:
         header += f"{META_SEPARATOR}{','.join(all_cols)}"
         lines.append(header)
 
-        for i in range(row_count):
-            row = flat_stream[i]
-            tokens: List[str] = []
-
-            for col in delta_cols:
-                val = row.get(col)
-                if i == 0:
-                    tokens.append(str(val))
-                else:
-                    prev = flat_stream[i-1].get(col)
-                    diff = val - prev
-                    if isinstance(diff, float):
-                        diff = round(diff, 10)
-                        if diff.is_integer():
-                            diff = int(diff)
-                    tokens.append(f"+{diff}" if diff >= 0 else str(diff))
-
-            for col in regular_cols:
-                if col not in row:
-                    tokens.append('')
-                elif row[col] is None:
-                    tokens.append('null')
-                else:
-                    tokens.append(self._format_value(row[col]))
-
-            for col in optional_cols:
-                if col in row and row[col] is not None:
-                    val = self._format_value(row[col])
-                    tokens.append(f"{col}:{val}")
-
-            lines.append(','.join(tokens))
+        optional_prefixes = [(col, col + ':') for col in optional_cols]
+        format_value = self._cell_formatter()
+
+        if columns is None:
+            columns = {col: [row.get(col) for row in flat_stream] for col in delta_cols + regular_cols + optional_cols}
+
+        # Delta and regular cells are produced a column at a time and
+        # zipped back into rows; delta cells are diffed against a local
+        # rather than the previous row's dict.
+        token_columns = [self._delta_tokens(columns[col]) for col in delta_cols]
+        token_columns.extend(
+            self._format_table_column(col, columns[col], flat_stream, format_value)
+            for col in regular_cols
+        )
+        core_rows = map(','.join, zip(*token_columns))
+
+        if not optional_prefixes:
+            # Rows of a uniform table have no optional cells to append.
+            lines.extend(core_rows)
+            return lines
+
+        # Optional cells are appended as columns of ",key:value" suffixes,
+        # empty where the row has no value for the key.
+        suffix_columns = [
+            ['' if value is None else ',' + prefix + format_value(value) for value in columns[col]]
+            for col, prefix in optional_prefixes
+        ]
+        lines.extend(map(''.join, zip(core_rows, *suffix_columns)))
 
         return lines
 
-    def _write_standard_table(self, flat_stream: List[Dict], cols: List[str], row_count: int, key: str) -> List[str]:
+    def _write_standard_table(
+        self,
+        flat_stream: List[Dict],
+        cols: List[str],
+        row_count: int,
+        key: str,
+        columns: Optional[Dict[str, List[Any]]] = None
+    ) -> List[str]:
         """Write a standard table without special encoding.
         
         Args:
@@ -346,6 +514,8 @@ class ZonEncoder:
             cols: Column names
             row_count: Number of rows
             key: Table key/name
+            columns: Optional column values in row order (None for missing
+                cells), as built by _write_table
             
         Returns:
             List of ZON table lines
@@ -365,16 +535,21 @@ class ZonEncoder:
         header += f"{META_SEPARATOR}{','.join(visible_cols)}"
         lines.append(header)
 
-        for row in flat_stream:
-            tokens: List[str] = []
-            for col in visible_cols:
-                if col not in row:
-                    tokens.append('')
-                elif row[col] is None:
-                    tokens.append('null')
-                else:
-                    tokens.append(self._format_value(row[col]))
-            lines.append(','.join(tokens))
+        format_value = self._cell_formatter()
+        if columns is None:
+            columns = {col: [row.get(col) for row in flat_stream] for col in visible_cols}
+
+        if not visible_cols:
+            lines.extend([''] * len(flat_stream))
+            return lines
+
+        # Cells are formatted a column at a time and the token columns
+        # zipped back into rows.
+        token_columns = [
+            self._format_table_column(col, columns[col], flat_stream, format_value)
+            for col in visible_cols
+        ]
+        lines.extend(map(','.join, zip(*token_columns)))
 
         return lines
 
@@ -384,7 +559,8 @@ class ZonEncoder:
         core_columns: List[str],
         optional_columns: List[str],
         row_count: int,
-        key: str
+        key: str,
+        columns: Optional[Dict[str, List[Any]]] = None
     ) -> List[str]:
         """Write a table with sparse encoding for optional columns.
         
@@ -397,6 +573,8 @@ class ZonEncoder:
             optional_columns: Columns present in few rows (< 70%)
             row_count: Number of rows
             key: Table key/name
+            columns: Optional column values in row order (None for missing
+                cells), as built by _write_table
             
         Returns:
             List of ZON table lines with sparse encoding
@@ -416,37 +594,108 @@ class ZonEncoder:
         header += f"{META_SEPARATOR}{','.join(visible_core_columns)}"
         lines.append(header)
 
-        for row in flat_stream:
-            tokens: List[str] = []
+        optional_prefixes = [(col, col + ':') for col in optional_columns]
+
+        format_value = self._cell_formatter()
+
+        if columns is None:
+            columns = {col: [row.get(col) for row in flat_stream] for col in visible_core_columns}
+        # Core cells are written for every row (missing ones as null), so
+        # they are formatted a column at a time.
+        core_tokens = [self._format_column(columns[col], format_value) for col in visible_core_columns]
+        if not core_tokens:
+            for row in flat_stream:
+                lines.append(','.join([prefix + format_value(row[col]) for col, prefix in optional_prefixes if col in row]))
+            return lines
+
+        # Optional cells become a column of ",key:value" suffixes (empty
+        # where the row lacks the key), so every row is assembled by one
+        # join over its core and suffix cells.
+        suffix_columns = [
+            [',' + prefix + format_value(row[col]) if col in row else '' for row in flat_stream]
+            for col, prefix in optional_prefixes
+        ]
+        lines.extend(map(''.join, zip(map(','.join, zip(*core_tokens)), *suffix_columns)))
 
-            for col in visible_core_columns:
-                tokens.append(self._format_value(row.get(col)))
+        return lines
 
-            for col in optional_columns:
-                if col in row:
-                    val = self._format_value(row[col])
-                    tokens.append(f"{col}:{val}")
+    def _format_column(self, values: List[Any], format_cell: Callable[[Any], str]) -> List[str]:
+        """Format every value of one column.
+        
+        A column holding a single scalar type (all ints, all floats, ...),
+        possibly mixed with None, is mapped through that type's formatter
+        directly; anything else goes through format_cell value by value.
+        
+        Args:
+            values: Column values in row order
+            format_cell: Formatter for individual cells (see _cell_formatter)
+            
+        Returns:
+            Cell tokens in row order
+        """
+        value_types = set(map(type, values))
+        has_null = _NoneType in value_types
+        value_types.discard(_NoneType)
+
+        if len(value_types) == 1:
+            value_type = value_types.pop()
+            if value_type is float and not has_null:
+                tokens = _format_float_column(values)
+                if tokens is not None:
+                    return tokens
+            formatter = _SCALAR_FORMATTERS.get(value_type)
+            if formatter is not None:
+                if has_null:
+                    return ['null' if value is None else formatter(value) for value in values]
+                return list(map(formatter, values))
+        return list(map(format_cell, values))
+
+    def _format_table_column(
+        self,
+        col: str,
+        values: List[Any],
+        flat_stream: List[Dict],
+        format_cell: Callable[[Any], str]
+    ) -> List[str]:
+        """Format one column of a table where rows may lack the column.
+        
+        Cells of rows without the column are left empty, while present
+        None values are written as null.
+        
+        Args:
+            col: Column name
+            values: Column values in row order (None for missing cells)
+            flat_stream: Flattened rows the values were taken from
+            format_cell: Formatter for individual cells (see _cell_formatter)
+            
+        Returns:
+            Cell tokens in row order
+        """
+        tokens = self._format_column(values, format_cell)
 
-            lines.append(','.join(tokens))
+        if _NoneType in set(map(type, values)):
+            for index, value in enumerate(values):
+                if value is None and col not in flat_stream[index]:
+                    tokens[index] = ''
 
-        return lines
+        return tokens
 
-    def _analyze_column_sparsity(self, data: List[Dict], cols: List[str]) -> List[Dict]:
+    def _analyze_column_sparsity(self, columns: Dict[str, List[Any]]) -> List[Dict]:
         """Analyze how frequently each column appears in the data.
         
         Args:
-            data: List of dict objects
-            cols: Column names to analyze
+            columns: Column names mapped to their values in row order, with
+                None for rows where the column is missing
             
         Returns:
             List of dicts with 'name' and 'presence' (0.0 to 1.0) for each column
         """
         result = []
-        for col in cols:
-            presence_count = sum(1 for row in data if col in row and row[col] is not None)
+        for col, values in columns.items():
+            presence_count = sum(map(is_not, values, repeat(None)))
             result.append({
                 'name': col,
-                'presence': presence_count / len(data) if data else 0
+                'presence': presence_count / len(values) if values else 0
             })
         return result
 
@@ -462,29 +711,51 @@ class ZonEncoder:
         """
         return []
 
-    def _detect_dictionaries(self, data: List[Dict], cols: List[str]) -> Dict[str, List[str]]:
+    def _detect_dictionaries(self, columns: Dict[str, List[Any]]) -> Dict[str, List[str]]:
         """Detect columns suitable for dictionary compression.
         
         Identifies string columns with high repetition rates where dictionary
         encoding (replacing values with indices) would save tokens.
         
         Args:
-            data: List of dict objects
-            cols: Column names to analyze
+            columns: Column names mapped to their values in row order, with
+                None for rows where the column is missing
             
         Returns:
             Dict mapping column names to their unique value lists (dictionaries)
         """
         dictionaries: Dict[str, List[str]] = {}
 
-        for col in cols:
-            values = [row.get(col) for row in data if isinstance(row.get(col), str)]
-            if len(values) < len(data) * 0.8:
+        for col, column in columns.items():
+            # Columns without any strings (numbers, flags) cannot become
+            # dictionaries, and all-string columns need no filtering.
+            value_types = set(map(type, column))
+            if value_types == _STR_TYPES:
+                values = column
+            elif value_types == _OPTIONAL_STR_TYPES:
+                values = [v for v in column if v is not None]
+            elif any(issubclass(value_type, str) for value_type in value_types):
+                values = [v for v in column if isinstance(v, str)]
+            else:
+                continue
+
+            if len(values) < len(column) * 0.8:
                 continue
 
-            unique_values = sorted(list(set(values)))
             if not values:
                 continue
+
+            # A dictionary holds at most _MAX_DICTIONARY_SIZE entries, so stop
+            # collecting distinct values as soon as a column has more.
+            distinct: Set[str] = set()
+            for start in range(0, len(values), _DICTIONARY_SCAN_CHUNK):
+                distinct.update(values[start:start + _DICTIONARY_SCAN_CHUNK])
+                if len(distinct) > _MAX_DICTIONARY_SIZE:
+                    break
+            if len(distinct) > _MAX_DICTIONARY_SIZE:
+                continue
+
+            unique_values = sorted(distinct)
                 
             repetition_rate = 1 - (len(unique_values) / len(values))
             avg_length = sum(len(v) for v in unique_values) / len(unique_values)
@@ -500,7 +771,7 @@ class ZonEncoder:
 
             threshold = 0.1 if len(values) < 20 else 0.2
 
-            if savings > threshold and len(unique_values) < len(values) / 2 and len(unique_values) <= 50:
+            if savings > threshold and len(unique_values) < len(values) / 2 and len(unique_values) <= _MAX_DICTIONARY_SIZE:
                 dictionaries[col] = unique_values
 
         return dictionaries
@@ -511,7 +782,8 @@ class ZonEncoder:
         cols: List[str],
         dictionaries: Dict[str, List[str]],
         row_count: int,
-        key: str
+        key: str,
+        columns: Optional[Dict[str, List[Any]]] = None
     ) -> List[str]:
         """Write a table with dictionary-compressed columns.
         
@@ -524,6 +796,8 @@ class ZonEncoder:
             dictionaries: Dict mapping column names to value lists
             row_count: Number of rows
             key: Table key/name
+            columns: Optional column values in row order (None for missing
+                cells), as built by _write_table
             
         Returns:
             List of ZON lines (dictionary definitions + table)
@@ -544,26 +818,31 @@ class ZonEncoder:
         header += f"{META_SEPARATOR}{','.join(all_cols)}"
         lines.append(header)
 
-        for row in flat_stream:
-            tokens: List[str] = []
-
-            for col in dict_cols:
-                value = row.get(col)
-                if value in dictionaries[col]:
-                    index = dictionaries[col].index(value)
-                    tokens.append(str(index))
-                else:
-                    tokens.append(self._format_value(value))
-
-            for col in regular_cols:
-                if col not in row:
-                    tokens.append('')
-                elif row[col] is None:
-                    tokens.append('null')
-                else:
-                    tokens.append(self._format_value(row[col]))
-
-            lines.append(','.join(tokens))
+        index_tokens = {
+            col: {value: str(index) for index, value in enumerate(values)}
+            for col, values in dictionaries.items()
+        }
+
+        format_value = self._cell_formatter()
+        if columns is None:
+            columns = {col: [row.get(col) for row in flat_stream] for col in cols}
+
+        # Dictionary cells are written for every row (missing ones as
+        # null), so they are resolved a column at a time.
+        dict_token_columns: List[List[str]] = []
+        for col in dict_cols:
+            col_tokens = index_tokens[col]
+            token_column: List[str] = []
+            for value in columns[col]:
+                index_token = col_tokens.get(value) if isinstance(value, str) else None
+                token_column.append(index_token if index_token is not None else format_value(value))
+            dict_token_columns.append(token_column)
+
+        token_columns = dict_token_columns + [
+            self._format_table_column(col, columns[col], flat_stream, format_value)
+            for col in regular_cols
+        ]
+        lines.extend(map(','.join, zip(*token_columns)))
 
         return lines
 
@@ -582,35 +861,32 @@ class ZonEncoder:
         if not data:
             return 0.0
 
-        all_keys: Set[str] = set()
-        key_sets: List[Set[str]] = []
-        
+        # Rows of the same shape share a key set, so compare each distinct
+        # key set once and weight the result by how many rows use it.
+        shape_counts: Dict[FrozenSet[str], int] = {}
         for item in data:
-            keys = set(item.keys())
-            key_sets.append(keys)
-            all_keys.update(keys)
+            keys = frozenset(item)
+            shape_counts[keys] = shape_counts.get(keys, 0) + 1
+
+        if not any(shape_counts):
+            return 0.0
 
-        total_keys = len(all_keys)
-        if total_keys == 0:
+        row_count = len(data)
+        comparisons = row_count * (row_count - 1) // 2
+        if comparisons == 0:
             return 0.0
 
-        total_overlap = 0.0
-        comparisons = 0
+        # Pairs of rows with identical key sets are fully similar.
+        total_overlap = float(sum(count * (count - 1) // 2 for count in shape_counts.values()))
 
-        for i in range(len(key_sets)):
-            for j in range(i + 1, len(key_sets)):
-                keys1 = key_sets[i]
-                keys2 = key_sets[j]
-                
+        shapes = list(shape_counts.items())
+        for i, (keys1, count1) in enumerate(shapes):
+            for keys2, count2 in shapes[i + 1:]:
                 shared = len(keys1 & keys2)
                 union = len(keys1) + len(keys2) - shared
                 similarity = shared / union if union > 0 else 1.0
-                
-                total_overlap += similarity
-                comparisons += 1
 
-        if comparisons == 0:
-            return 0.0
+                total_overlap += similarity * count1 * count2
 
         avg_similarity = total_overlap / comparisons
         irregularity = 1 - avg_similarity
@@ -630,39 +906,97 @@ class ZonEncoder:
         Raises:
             ZonEncodeError: If circular reference is detected
         """
-        if visited is None:
-            visited = set()
+        out: List[str] = []
+        self._write_zon_node(val, out, set(visited) if visited else set())
+        return ''.join(out)
+
+    def _write_zon_node(self, val: Any, out: List[str], visited: set) -> None:
+        """Append the inline ZON fragments of a value to a shared buffer.
+        
+        Nested objects and arrays write into the same ``out`` list, so the
+        node is joined once at the top instead of at every level.
+        
+        Args:
+            val: Value to format
+            out: Buffer receiving the string fragments
+            visited: IDs of the containers on the current path; entries are
+                removed again on the way out, so shared (non-circular)
+                references are allowed
             
-        if isinstance(val, (dict, list)):
+        Raises:
+            ZonEncodeError: If circular reference is detected
+        """
+        if isinstance(val, dict):
+            if not val:
+                out.append("{}")
+                return
             val_id = id(val)
             if val_id in visited:
                 raise ZonEncodeError('Circular reference detected')
             visited.add(val_id)
 
-        if isinstance(val, dict):
-            if not val:
-                return "{}"
-            keys = sorted(val.keys())
-            items: List[str] = []
-            for k in keys:
+            out.append("{")
+            first = True
+            for k in sorted(val.keys()):
+                if first:
+                    first = False
+                else:
+                    out.append(",")
+
                 v = val[k]
                 k_str = str(k)
-                if re.search(r'[,:\{\}\[\]"]', k_str):
+                if _NODE_KEY_QUOTE_RE.search(k_str):
                     k_str = json.dumps(k_str)
+                out.append(k_str)
 
-                v_str = self._format_zon_node(v, visited.copy())
-                
-                if v_str.startswith('{') or v_str.startswith('['):
-                    items.append(f"{k_str}{v_str}")
+                if isinstance(v, (dict, list)):
+                    self._write_zon_node(v, out, visited)
                 else:
-                    items.append(f"{k_str}:{v_str}")
-            return "{" + ",".join(items) + "}"
-            
+                    v_str = self._format_node_scalar(v)
+                    if not (v_str.startswith('{') or v_str.startswith('[')):
+                        out.append(":")
+                    out.append(v_str)
+            out.append("}")
+
+            visited.discard(val_id)
+            return
+
         if isinstance(val, list):
             if not val:
-                return "[]"
-            return "[" + ",".join(self._format_zon_node(item, visited.copy()) for item in val) + "]"
+                out.append("[]")
+                return
+            val_id = id(val)
+            if val_id in visited:
+                raise ZonEncodeError('Circular reference detected')
+            visited.add(val_id)
+
+            out.append("[")
+            first = True
+            for item in val:
+                if first:
+                    first = False
+                else:
+                    out.append(",")
+                if isinstance(item, (dict, list)):
+                    self._write_zon_node(item, out, visited)
+                else:
+                    out.append(self._format_node_scalar(item))
+            out.append("]")
+
+            visited.discard(val_id)
+            return
+
+        out.append(self._format_node_scalar(val))
+
+    def _format_node_scalar(self, val: Any) -> str:
+        """Format a non-container value inside an inline ZON node.
+        
+        Args:
+            val: Scalar value to format
             
+        Returns:
+            ZON representation of the value
+        """
         if val is None:
             return "null"
         if val is True:
@@ -675,19 +1009,19 @@ class ZonEncoder:
         s = str(val)
 
         if '\n' in s or '\r' in s:
-            return json.dumps(s, ensure_ascii=False)
+            return json_string(s)
 
         if self.type_inferrer._is_iso_date(s):
             return s
 
         if self._needs_type_protection(s):
-            return json.dumps(s, ensure_ascii=False)
+            return json_string(s)
 
         if not s.strip():
-            return json.dumps(s, ensure_ascii=False)
+            return json_string(s)
 
-        if re.search(r'[,\{\}\[\]"]', s):
-            return json.dumps(s, ensure_ascii=False)
+        if _NODE_STRING_QUOTE_RE.search(s):
+            return json_string(s)
 
         return s
 
@@ -700,49 +1034,39 @@ class ZonEncoder:
         Returns:
             ZON-formatted string representation
         """
-        if val is None:
-            return "null"
-        if val is True:
-            return "T"
-        if val is False:
-            return "F"
+        val_type = type(val)
+        formatter = _SCALAR_FORMATTERS.get(val_type)
+        if formatter is not None:
+            return formatter(val)
+        if val_type is str:
+            return self._format_string(val)
+        if val_type is list or val_type is dict:
+            return self._format_zon_node(val)
+
+        # Subclasses of the built-in types (and other objects) land here.
         if isinstance(val, bool):
             return "T" if val else "F"
-        if isinstance(val, (int, float)):
-            if isinstance(val, float):
-                if not math.isfinite(val):
-                    return "null"
-            
-            
-            if isinstance(val, int):
-                return str(val)
-            
-            if isinstance(val, float):
-                if val.is_integer():
-                    return f"{int(val)}.0"
-                else:
-                    s = str(val)
-                    if 'e' in s.lower():
-                        parts = re.split(r'[eE]', s)
-                        mantissa = float(parts[0])
-                        exponent = int(parts[1])
-                        
-                        if exponent >= 0:
-                            result = mantissa * (10 ** exponent)
-                            s = str(result)
-                            if '.' not in s:
-                                s += '.0'
-                        else:
-                            pass
-                    return s
+        if isinstance(val, int):
+            return str(val)
+        if isinstance(val, float):
+            return _format_float(val)
 
         if isinstance(val, (list, dict)):
             return self._format_zon_node(val)
 
-        s = str(val)
+        return self._format_string(str(val))
 
+    def _format_string(self, s: str) -> str:
+        """Format a string cell, quoting it only when it would be misread.
+        
+        Args:
+            s: String to format
+            
+        Returns:
+            The string, quoted or JSON-escaped where needed
+        """
         if '\n' in s or '\r' in s:
-            return json.dumps(s, ensure_ascii=False)
+            return json_string(s)
 
         if self.type_inferrer._is_iso_date(s):
             return s
@@ -755,6 +1079,43 @@ class ZonEncoder:
 
         return s
 
+    def _cell_formatter(self) -> Callable[[Any], str]:
+        """Create a _format_value variant that memoizes string and node cells.
+
+        String formatting runs the date, type-protection and quoting checks,
+        so repeated strings in a table (categories, status flags) are only
+        formatted once. Lists and dicts are cached by identity: rows built
+        from a shared template often reference the same object, and the
+        rows keep those objects alive (so their ids stay unique) for as
+        long as the formatter is used. Other types are cheap and passed
+        straight through.
+
+        Returns:
+            Function formatting a single table cell
+        """
+        format_value = self._format_value
+        format_string = self._format_string
+        format_node = self._format_zon_node
+        cache: Dict[str, str] = {}
+        node_cache: Dict[int, str] = {}
+
+        def format_cell(val: Any) -> str:
+            val_type = type(val)
+            if val_type is str:
+                token = cache.get(val)
+                if token is None:
+                    token = cache[val] = format_string(val)
+                return token
+            if val_type is list or val_type is dict:
+                node_id = id(val)
+                token = node_cache.get(node_id)
+                if token is None:
+                    token = node_cache[node_id] = format_node(val)
+                return token
+            return format_value(val)
+
+        return format_cell
+
     def _needs_type_protection(self, s: str) -> bool:
         """Check if a string needs quoting to prevent misinterpretation.
         
@@ -764,27 +1125,19 @@ class ZonEncoder:
         Returns:
             True if the string would be misinterpreted without quotes
         """
-        s_lower = s.lower()
-        
-        if s_lower in ['t', 'f', 'true', 'false', 'null', 'none', 'nil']:
+        if s.lower() in _KEYWORD_STRINGS:
             return True
         
-        if s in [GAS_TOKEN, LIQUID_TOKEN]:
+        if s in _MARKER_TOKENS:
             return True
         
         if s.strip() != s:
             return True
         
-        if any(ord(c) <= 0x1F for c in s):
-            return True
-
-        if re.match(r'^-?\d+$', s):
-            return True
-
-        if re.match(r'^-?\d+\.\d+$', s):
+        if _CONTROL_CHAR_RE.search(s):
             return True
 
-        if re.match(r'^-?\d+(\.\d+)?[eE][+-]?\d+$', s):
+        if _PROTECTED_NUMBER_RE.match(s):
             return True
         
         if s and (s[0].isdigit() or s[-1].isdigit()):
@@ -809,24 +1162,25 @@ class ZonEncoder:
         if not s:
             return True
 
-        if s in ['T', 'F', 'null', GAS_TOKEN, LIQUID_TOKEN]:
+        if s in _RESERVED_TOKENS:
             return True
 
-        if re.match(r'^-?\d+$', s):
-            return True
-        try:
-            float(s)
-            return True
-        except ValueError:
-            pass
+        if _FLOAT_HINT_RE.search(s):
+            if _INTEGER_RE.match(s):
+                return True
+            try:
+                float(s)
+                return True
+            except ValueError:
+                pass
 
         if s.strip() != s:
             return True
 
-        if re.match(r'^[+-]?(\d|\.\d)', s):
-             return True
+        if _NUMBER_START_RE.match(s):
+            return True
 
-        if re.search(r'[,:}\n\r\t"\[\]|;]', s):
+        if _QUOTE_CHARS_RE.search(s):
             return True
 
         return False
@@ -838,7 +1192,7 @@ class ZonEncoder:
         sep: str = '.',
         max_depth: int = 0,
         current_depth: int = 0,
-        visited: Optional[set] = None
+        key_cache: Optional[Dict[str, Dict[str, str]]] = None
     ) -> Dict:
         """Flatten nested dict to dot-notation keys.
         
@@ -847,8 +1201,10 @@ class ZonEncoder:
             parent: Parent key prefix
             sep: Separator for nested keys
             max_depth: Maximum nesting depth to flatten
-            current_depth: Current depth in recursion
-            visited: Set of visited object IDs for circular reference detection
+            current_depth: Depth of d within the original structure
+            key_cache: Flattened names of string keys by prefix, shared
+                across the rows of one table so each name is built (and
+                interned) once
             
         Returns:
             Flattened dictionary with dot-notation keys
@@ -856,29 +1212,50 @@ class ZonEncoder:
         Raises:
             ZonEncodeError: If circular reference is detected
         """
-        if visited is None:
-            visited = set()
-            
-        if isinstance(d, dict):
-            d_id = id(d)
-            if d_id in visited:
-                raise ZonEncodeError('Circular reference detected')
-            visited.add(d_id)
-
-        if not isinstance(d, dict) or d is None or isinstance(d, list):
+        if not isinstance(d, dict):
             return {parent: d} if parent else {}
 
-        items: List[Tuple[str, Any]] = []
-        for k, v in d.items():
-            new_key = f"{parent}{sep}{k}" if parent else k
+        if key_cache is None:
+            key_cache = {}
+
+        flat: Dict = {}
+        # Depth-first walk with an explicit stack of item iterators, so keys
+        # keep their insertion order without a call frame per nested dict.
+        # The stack holds the dicts on the current path, which is all the
+        # circular reference check needs.
+        stack = [(iter(d.items()), parent, current_depth, d)]
+        while stack:
+            items, prefix, depth, _ = stack[-1]
+            # Only string keys are cached: 1, 1.0 and True are one dict key
+            # but must keep their own names.
+            names = None
+            if prefix and type(prefix) is str:
+                names = key_cache.get(prefix)
+                if names is None:
+                    names = key_cache[prefix] = {}
+
+            for k, v in items:
+                if not prefix:
+                    new_key = k
+                elif names is not None and type(k) is str:
+                    new_key = names.get(k)
+                    if new_key is None:
+                        new_key = names[k] = sys.intern(f"{prefix}{sep}{k}")
+                else:
+                    new_key = f"{prefix}{sep}{k}"
+
+                if isinstance(v, dict) and v and depth < max_depth:
+                    for frame in stack:
+                        if frame[3] is v:
+                            raise ZonEncodeError('Circular reference detected')
+                    stack.append((iter(v.items()), new_key, depth + 1, v))
+                    break
 
-            if isinstance(v, dict) and v and v is not None and not isinstance(v, list) and current_depth < max_depth:
-                flattened = self._flatten(v, new_key, sep, max_depth, current_depth + 1, visited.copy())
-                items.extend(flattened.items())
+                flat[new_key] = v
             else:
-                items.append((new_key, v))
-        return dict(items)
+                stack.pop()
 
+        return flat
 
 def encode(data: Any, anchor_interval: int = DEFAULT_ANCHOR_INTERVAL, options: Dict[str, bool] = None) -> str:
     """Encode data to ZON format (convenience function).
@@ -886,7 +1263,8 @@ def encode(data: Any, anchor_interval: int = DEFAULT_ANCHOR_INTERVAL, options: D
     Args:
         data: Python data structure to encode
         anchor_interval: Interval for anchor points in streams
-        options: Optional dict with encoding options (e.g., {'type_coercion': True})
+        options: Optional dict with encoding options (e.g., {'type_coercion': True}
+            or {'sort_keys': False} to keep metadata keys in insertion order)
         
     Returns:
         ZON-encoded string
@@ -895,7 +1273,8 @@ def encode(data: Any, anchor_interval: int = DEFAULT_ANCHOR_INTERVAL, options: D
     return ZonEncoder(
         anchor_interval, 
         enable_dict_compression=True, 
-        enable_type_coercion=opts.get('type_coercion', False)
+        enable_type_coercion=opts.get('type_coercion', False),
+        sort_keys=opts.get('sort_keys', True)
     ).encode(data)
 
 def encode_llm(data: Any, context: Dict[str, Any]) -> str:
@@ -1,10 +1,14 @@
 """Streaming encoder and decoder for processing ZON data incrementally."""
 
+import re
 from typing import AsyncGenerator, Iterable, AsyncIterable, List, Optional, Any, Union
 from .encoder import ZonEncoder
 from .decoder import ZonDecoder
 from .utils import quote_string, parse_value
 
+# Characters that end a plain run of cell text in a streamed row.
+_ROW_BREAK_RE = re.compile(r'[",]')
+
 class ZonStreamEncoder:
     """Streaming encoder for ZON table format.
     
@@ -148,25 +152,33 @@ class ZonStreamDecoder:
         Returns:
             List of parsed values
         """
+        if '"' not in line:
+            return [parse_value(cell) for cell in line.split(',')]
+
         values = []
-        current = []
+        pieces: List[str] = []
         in_quotes = False
-        
-        i = 0
-        while i < len(line):
-            char = line[i]
-            if char == '"':
-                if in_quotes and i + 1 < len(line) and line[i + 1] == '"':
-                    current.append('"')
-                    i += 1
+        start = 0
+
+        for match in _ROW_BREAK_RE.finditer(line):
+            i = match.start()
+            if i < start:
+                continue
+
+            if match.group() == '"':
+                pieces.append(line[start:i])
+                if in_quotes and line.startswith('"', i + 1):
+                    pieces.append('"')
+                    start = i + 2
                 else:
                     in_quotes = not in_quotes
-            elif char == ',' and not in_quotes:
-                values.append(parse_value("".join(current)))
-                current = []
-            else:
-                current.append(char)
-            i += 1
-        
-        values.append(parse_value("".join(current)))
+                    start = i + 1
+            elif not in_quotes:
+                pieces.append(line[start:i])
+                values.append(parse_value(''.join(pieces)))
+                pieces = []
+                start = i + 1
+
+        pieces.append(line[start:])
+        values.append(parse_value(''.join(pieces)))
         return values
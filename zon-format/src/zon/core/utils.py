@@ -2,8 +2,57 @@
 
 import json
 import re
+import sys
+from functools import lru_cache
 from typing import Any, Optional
 
+# Tokens up to this length are memoized by parse_value; longer ones are
+# rarely repeated and would only pin memory in the cache.
+_PARSE_CACHE_MAX_LEN = 64
+
+# Plain string values up to this length are interned.
+_INTERN_MAX_LEN = 32
+
+# Loose shape of anything int() or float() could accept once the value is
+# known to start with a digit, sign or dot; other tokens skip the conversion.
+_NUMBER_SHAPE_RE = re.compile(r'[-+]?[\d_]*(?:\.[\d_]*)?(?:[eE][-+]?[\d_]+)?\Z')
+
+# Case-insensitive boolean and null keywords recognised by parse_value.
+_KEYWORD_VALUES = {
+    't': True, 'true': True,
+    'f': False, 'false': False,
+    'null': None, 'none': None, 'nil': None,
+}
+
+# Strings quote_string must quote so they are not read back as numbers or
+# keywords, and strings it can leave bare.
+_NUMERIC_STRING_RE = re.compile(r'^-?\d+(\.\d+)?$')
+_KEYWORD_STRING_RE = re.compile(r'^(true|false|t|f|null|none|nil)$', re.IGNORECASE)
+_BARE_STRING_RE = re.compile(r'^[a-zA-Z0-9_\-\.]+$')
+
+# Characters json.dumps(ensure_ascii=False) would backslash-escape, apart
+# from the double quote itself.
+_JSON_ESCAPE_RE = re.compile(r'[\x00-\x1f\\]')
+
+# json.dumps creates a new JSONEncoder on every call that passes options,
+# so the one configuration used for string literals is built once.
+_JSON_TEXT_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
+def json_string(s: str) -> str:
+    """Serialize a string as a JSON string literal.
+    
+    Same result as ``json.dumps(s, ensure_ascii=False)``.
+    
+    Args:
+        s: The string to serialize
+        
+    Returns:
+        The double-quoted, backslash-escaped string
+    """
+    return _JSON_TEXT_ENCODER.encode(s)
+
+
 def quote_string(s: str) -> str:
     """Quote a string value according to ZON format rules.
     
@@ -17,16 +66,21 @@ def quote_string(s: str) -> str:
     Returns:
         The appropriately quoted string for ZON format
     """
-    if re.match(r'^-?\d+(\.\d+)?$', s):
+    if _NUMERIC_STRING_RE.match(s):
         return f'"{s}"'
     
-    if re.match(r'^(true|false|t|f|null|none|nil)$', s, re.IGNORECASE):
+    if _KEYWORD_STRING_RE.match(s):
         return f'"{s}"'
     
-    if re.match(r'^[a-zA-Z0-9_\-\.]+$', s):
+    if _BARE_STRING_RE.match(s):
         return s
     
-    json_str = json.dumps(s, ensure_ascii=False)
+    if not _JSON_ESCAPE_RE.search(s):
+        # Only quotes need escaping, which JSON would write as \" and the
+        # replace below turns into "".
+        return '"' + s.replace('"', '""') + '"'
+
+    json_str = json_string(s)
     inner = json_str[1:-1]
     zon_str = inner.replace('\\"', '""')
     return f'"{zon_str}"'
@@ -45,17 +99,33 @@ def parse_value(val: str) -> Any:
         The parsed value as the appropriate Python type (bool, None, str,
         int, float, or the original string)
     """
+    if len(val) <= _PARSE_CACHE_MAX_LEN:
+        return _parse_value_cached(val)
+    return _parse_value(val)
+
+def _parse_value(val: str) -> Any:
+    """Uncached implementation of parse_value, dispatching on the first character."""
     trimmed = val.strip()
-    lower = trimmed.lower()
+    if not trimmed:
+        return trimmed
 
-    if lower in ('t', 'true'):
-        return True
-    if lower in ('f', 'false'):
-        return False
-    if lower in ('null', 'none', 'nil'):
-        return None
+    first = trimmed[0]
 
-    if trimmed.startswith('"'):
+    if first.isdigit() or first in '-+.':
+        digits = trimmed[1:] if first in '-+' else trimmed
+        if digits.isdecimal():
+            return int(trimmed)
+        if digits.replace('.', '', 1).isdecimal():
+            return float(trimmed)
+        if _NUMBER_SHAPE_RE.match(trimmed):
+            try:
+                if '.' not in trimmed and 'e' not in trimmed and 'E' not in trimmed:
+                    return int(trimmed)
+                return float(trimmed)
+            except ValueError:
+                pass
+
+    elif first == '"':
         try:
             return json.loads(trimmed)
         except json.JSONDecodeError:
@@ -64,12 +134,15 @@ def parse_value(val: str) -> Any:
                 json_str = inner.replace('""', '\\"')
                 return json.loads(f'"{json_str}"')
 
-    if trimmed:
-        try:
-            if '.' not in trimmed and 'e' not in lower:
-                return int(trimmed)
-            return float(trimmed)
-        except ValueError:
-            pass
+    elif first in 'tTfFnN' and len(trimmed) <= 5:
+        lower = trimmed.lower()
+        if lower in _KEYWORD_VALUES:
+            return _KEYWORD_VALUES[lower]
 
+    if len(trimmed) <= _INTERN_MAX_LEN:
+        return sys.intern(trimmed)
     return trimmed
+
+# Every result is an immutable scalar, so repeated tokens (flags, enums,
+# small numbers) can safely share one parsed value.
+_parse_value_cached = lru_cache(maxsize=65536)(_parse_value)
@@ -5,6 +5,11 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
+_BOOLEAN_STRING_RE = re.compile(r'^(true|false|yes|no|1|0)$', re.IGNORECASE)
+_NUMBER_STRING_RE = re.compile(r'^-?\d+(\.\d+)?([eE][+-]?\d+)?$')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d{3})?(Z|[-+]\d{2}:?\d{2})?)?$')
+
+
 class TypeInferrer:
     """Infers and coerces data types for ZON encoding and decoding.
     
@@ -24,10 +29,10 @@ class TypeInferrer:
         if isinstance(value, str):
             trimmed = value.strip()
             
-            if re.match(r'^(true|false|yes|no|1|0)$', trimmed, re.IGNORECASE):
+            if _BOOLEAN_STRING_RE.match(trimmed):
                 return {'type': 'boolean', 'coercible': True, 'original': 'string'}
 
-            if re.match(r'^-?\d+(\.\d+)?([eE][+-]?\d+)?$', trimmed):
+            if _NUMBER_STRING_RE.match(trimmed):
                 return {'type': 'number', 'coercible': True, 'original': 'string'}
             
             if self._is_iso_date(trimmed):
@@ -123,7 +128,7 @@ class TypeInferrer:
         if isinstance(v, (int, float)) and not isinstance(v, bool):
             return True
         if isinstance(v, str):
-            return bool(re.match(r'^-?\d+(\.\d+)?([eE][+-]?\d+)?$', v.strip()))
+            return bool(_NUMBER_STRING_RE.match(v.strip()))
         return False
 
     def _is_boolean(self, v: Any) -> bool:
@@ -131,7 +136,7 @@ class TypeInferrer:
         if isinstance(v, bool):
             return True
         if isinstance(v, str):
-            return bool(re.match(r'^(true|false|yes|no|1|0)$', v.strip(), re.IGNORECASE))
+            return bool(_BOOLEAN_STRING_RE.match(v.strip()))
         return False
 
     def _is_date(self, v: Any) -> bool:
@@ -159,4 +164,4 @@ class TypeInferrer:
 
     def _is_iso_date(self, s: str) -> bool:
         """Check if a string matches ISO 8601 date format."""
-        return bool(re.match(r'^\d{4}-\d{2}-\d{2}(T\d{2}:\d{2}:\d{2}(\.\d{3})?(Z|[-+]\d{2}:?\d{2})?)?$', s))
+        return bool(_ISO_DATE_RE.match(s))
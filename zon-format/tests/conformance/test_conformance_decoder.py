@@ -76,6 +76,33 @@ users:@(2):id,name
         self.assertEqual(result['users'][0], {'id': 1, 'name': 'Alice'})
         self.assertEqual(result['users'][1], {'id': 2, 'name': 'Bob'})
 
+    def test_parse_quoted_cells_next_to_plain_rows(self):
+        """Should split quoted cells and keep inline nodes in table rows."""
+        zon_data = 'rows:@(3):id,note\n1,"a, b"\n2,plain\n3,{x:1}'
+        result = zon.decode(zon_data)
+
+        self.assertEqual(result['rows'], [
+            {'id': 1, 'note': 'a, b'},
+            {'id': 2, 'note': 'plain'},
+            {'id': 3, 'note': {'x': 1}}
+        ])
+        self.assertEqual(
+            zon.decode('@2:id,note\n1,"say ""hi"""\n2,x'),
+            [{'id': 1, 'note': 'say "hi"'}, {'id': 2, 'note': 'x'}]
+        )
+
+    def test_parse_table_header_formats(self):
+        """Should parse named, value and anonymous headers with omitted columns."""
+        self.assertEqual(zon.decode('@t(1):a\n5'), {'t': [{'a': 5}]})
+        self.assertEqual(zon.decode('@(1):a\n5'), [{'a': 5}])
+        self.assertEqual(
+            zon.decode('@2[id][pos]:a\nx\ny'),
+            [{'a': 'x', 'id': 1, 'pos': 1}, {'a': 'y', 'id': 2, 'pos': 2}]
+        )
+
+        with self.assertRaises(ZonDecodeError):
+            zon.decode('@x(1:a\n5')
+
     def test_preserve_key_order_from_document(self):
         """Should preserve key order from document."""
         zon_data = 'z:1\na:2\nm:3'
@@ -130,6 +157,25 @@ users:@(2):id,name
         self.assertEqual(result['config']['db']['host'], 'localhost')
         self.assertEqual(result['config']['db']['port'], 5432)
 
+    def test_reconstruct_nesting_below_array_indices(self):
+        """Should keep nesting below array indices and skip conflicting keys."""
+        zon_data = 'a.0.b.c:1\na.1.d:2\nx:5\nx.y:6'
+        result = zon.decode(zon_data)
+
+        self.assertEqual(result['a'], [{'b': {'c': 1}}, {'d': 2}])
+        self.assertEqual(result['x'], 5)
+
+    def test_reconstruct_indexed_columns_per_row(self):
+        """Should rebuild arrays from indexed dotted columns in every row."""
+        zon_data = '@2:id,items.0.x,items.1.y\n1,a,b\n2,c,d'
+        result = zon.decode(zon_data)
+
+        self.assertEqual(result, [
+            {'id': 1, 'items': [{'x': 'a'}, {'y': 'b'}]},
+            {'id': 2, 'items': [{'x': 'c'}, {'y': 'd'}]}
+        ])
+        self.assertIsNot(result[0]['items'], result[1]['items'])
+
     def test_unwrap_pure_lists_data_key(self):
         """Should unwrap pure lists (data key)."""
         zon_data = """
@@ -153,6 +199,14 @@ users:@(2):id,name
         
         self.assertEqual(result['users'][0]['name'], '')
 
+    def test_parse_spaced_nested_keys_regardless_of_siblings(self):
+        """Should treat spaced colon-less nested keys the same whatever the sibling values."""
+        self.assertEqual(zon.decode('x:{a:1, b{c:1}}'), {'x': {'a': 1}})
+        self.assertEqual(zon.decode('x:{a:x, b{c:1}}'), {'x': {'a': 'x'}})
+        self.assertEqual(zon.decode('x:{a:1, b[1,2]}'), {'x': {'a': 1}})
+        self.assertEqual(zon.decode('x:{b {c:1}}'), {'x': {}})
+        self.assertEqual(zon.decode('x:{a:1,b{c:1}}'), {'x': {'a': 1, 'b': {'c': 1}}})
+
 
 if __name__ == '__main__':
     unittest.main()
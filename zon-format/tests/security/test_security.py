@@ -67,6 +67,15 @@ class TestSecurity(unittest.TestCase):
         
         self.assertIn('Circular reference detected', str(context.exception))
 
+    def test_shared_reference_is_not_circular(self):
+        """Should allow the same object to appear in sibling positions."""
+        shared = {'k': [1, 2]}
+        data = {'items': [shared, shared], 'other': {'ref': shared}}
+
+        encoded = zon.encode(data)
+
+        self.assertEqual(zon.decode(encoded), data)
+
 
 if __name__ == '__main__':
     unittest.main()
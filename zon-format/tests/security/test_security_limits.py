@@ -41,6 +41,16 @@ class TestSecurityLimits(unittest.TestCase):
         
         self.assertIn('E302', str(context.exception))
 
+    def test_e302_line_length_limit_in_table_rows(self):
+        """Should throw when a table row exceeds 1MB (E302)."""
+        doc = '@2:id\n1\n' + 'x' * (MAX_LINE_LENGTH + 1)
+
+        with self.assertRaises(ZonDecodeError) as context:
+            zon.decode(doc)
+
+        self.assertEqual(context.exception.code, 'E302')
+        self.assertEqual(context.exception.line, 3)
+
     def test_e302_allow_lines_under_1mb(self):
         """Should allow lines under 1MB."""
         line = 'key:' + 'x' * 1000
@@ -150,6 +150,17 @@ class TestCanonicalNumbers(unittest.TestCase):
         self.assertIn('42', encoded)
         self.assertIn('3.14', encoded)
 
+    def test_decode_number_like_tokens(self):
+        """Should decode numbers and keep number-like strings as strings."""
+        decoded = zon.decode('a:-12\nb:.5\nc:1e3\nd:2024-01-15\ne:1.2.3\nf:-inf')
+
+        self.assertEqual(decoded['a'], -12)
+        self.assertEqual(decoded['b'], 0.5)
+        self.assertEqual(decoded['c'], 1000.0)
+        self.assertEqual(decoded['d'], '2024-01-15')
+        self.assertEqual(decoded['e'], '1.2.3')
+        self.assertEqual(decoded['f'], '-inf')
+
 
 if __name__ == '__main__':
     unittest.main()
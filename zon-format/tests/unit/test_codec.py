@@ -1,3 +1,4 @@
+import io
 import unittest
 import zon
 from zon.core.constants import *
@@ -35,6 +36,27 @@ class TestCodec(unittest.TestCase):
         decoded = zon.decode(encoded)
         self.assertEqual(decoded, data)
 
+    def test_decode_bytes_input(self):
+        """Test decoding UTF-8 bytes and memoryviews."""
+        data = [{"id": 1, "name": "Zoë"}, {"id": 2, "name": "Bob"}]
+        raw = zon.encode(data).encode("utf-8")
+
+        self.assertEqual(zon.decode(raw), data)
+        self.assertEqual(zon.decode(memoryview(raw)), data)
+
+    def test_decode_file(self):
+        """Test decoding from text and binary file objects."""
+        data = {"meta": {"v": 1}, "rows": [{"id": i, "name": "n%d" % i} for i in range(5)]}
+        text = zon.encode(data)
+
+        self.assertEqual(zon.decode_file(io.StringIO(text)), data)
+        self.assertEqual(zon.decode_file(io.BytesIO((text + "\n").encode("utf-8"))), data)
+        self.assertEqual(zon.decode_file(io.StringIO("[1,2]")), [1, 2])
+        self.assertEqual(zon.decode_file(io.StringIO("")), {})
+
+        with self.assertRaises(zon.ZonDecodeError):
+            zon.decode_file(io.StringIO("@3:a\n1\n2"))
+
     def test_smart_packing(self):
         """Test minimal quoting for strings."""
         data = [{"name": "a1"}, {"name": "u1"}, {"name": "iv"}]
@@ -64,6 +86,82 @@ class TestCodec(unittest.TestCase):
         decoded = zon.decode(encoded)
         self.assertEqual(decoded, data)
 
+    def test_standard_table_missing_and_null_cells(self):
+        """Test that missing cells stay empty and None cells become null."""
+        data = [{"a": "x%d" % i, "b": None if i == 2 else i % 3} for i in range(9)]
+        data.append({"a": "last"})
+        encoded = zon.encode(data)
+
+        self.assertIn("\nx2,null\n", encoded)
+        self.assertTrue(encoded.endswith("\nlast,"))
+
+    def test_dictionary_table_missing_and_null_cells(self):
+        """Test that regular columns of a dictionary table keep missing and null cells apart."""
+        data = [{"status": "active" if i % 3 else "inactive", "note": None if i == 4 else "n%d" % i} for i in range(12)]
+        del data[7]["note"]
+        encoded = zon.encode(data)
+
+        self.assertIn("status[2]:", encoded)
+        self.assertIn("\n0,null\n", encoded)
+        self.assertIn("\n0,\n", encoded)
+        self.assertEqual(zon.decode(encoded)[4], {"status": "active", "note": None})
+
+    def test_standard_table_typed_columns(self):
+        """Test column-wise formatting of single-type columns mixed with None."""
+        data = [
+            {"n": None if i == 1 else i, "f": None if i == 3 else 0.5 * i, "b": i % 2 == 0, "s": "v,%d" % i}
+            for i in range(6)
+        ]
+        encoded = zon.ZonEncoder(enable_dict_compression=False).encode({"t": data})
+
+        self.assertIn("\nT,0.0,0,\"v,0\"\nF,0.5,null,\"v,1\"\nT,1.0,2,\"v,2\"\nF,null,3,", encoded)
+        self.assertEqual(zon.decode(encoded), {"t": data})
+
+    def test_shared_nested_cells(self):
+        """Test that rows sharing one list object encode like separate copies."""
+        tags = ["a", {"k": [1, 2]}]
+        shared = [{"id": "r%d" % i, "tags": tags} for i in range(4)]
+        copied = [{"id": "r%d" % i, "tags": ["a", {"k": [1, 2]}]} for i in range(4)]
+
+        self.assertEqual(zon.encode(shared), zon.encode(copied))
+        self.assertEqual(zon.decode(zon.encode(shared)), copied)
+
+    def test_flatten_equal_non_string_keys(self):
+        """Test that nested keys 1, True and 1.0 keep their own flattened names."""
+        data = [
+            {"id": 0, "m": {1: "x"}},
+            {"id": 1, "m": {True: "y"}},
+            {"id": 2, "m": {1: "z"}},
+            {"id": 3, "m": {1.0: "w"}},
+        ]
+        encoded = zon.encode(data)
+
+        self.assertIn("\n0,m.1:x\n1,m.True:y\n2,m.1:z\n3,m.1.0:w", encoded)
+        self.assertIn("True.a:0", zon.encode([{True: {"a": 0}}, {1: {"a": 1}}]))
+
+    def test_schema_cache(self):
+        """Test that an encoder reusing column names matches a fresh encoder."""
+        docs = [
+            [{"id": i, "user": {"name": "u%d" % i, "geo": {"lat": i}}} for i in range(3)],
+            [{"id": i, "user": {"name": "v%d" % i, "age": i}} for i in range(4)],
+        ]
+        encoder = zon.ZonEncoder(cache_schema=True)
+
+        for doc in docs + docs:
+            self.assertEqual(encoder.encode(doc), zon.encode(doc))
+        encoder.reset_schema_cache()
+        self.assertEqual(encoder.encode(docs[0]), zon.encode(docs[0]))
+
+    def test_schema_cache_non_string_keys(self):
+        """Test that a reused encoder keeps bool and int nested keys apart across documents."""
+        encoder = zon.ZonEncoder(cache_schema=True)
+        first = [{"id": i, "m": {1: "x"}} for i in range(3)]
+        second = [{"id": i, "m": {True: "b", 2.0: "c"}} for i in range(3)]
+
+        self.assertEqual(encoder.encode(first), zon.encode(first))
+        self.assertEqual(encoder.encode(second), zon.encode(second))
+        self.assertIn("@3:id,m.2.0,m.True", encoder.encode(second))
+
     def test_rle_compression(self):
         """Test encoding with repeated column values."""
         data = [{"id": i, "status": "ok"} for i in range(1, 51)]
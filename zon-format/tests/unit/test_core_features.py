@@ -26,6 +26,20 @@ class TestZonCoreFeatures(unittest.TestCase):
         self.assertEqual(decoded["int_val"], 127)
         self.assertEqual(decoded["small_float"], 0.0001)
 
+    def test_float_column_formatting(self):
+        """Test that float columns format like individual float cells."""
+        encoder = zon.ZonEncoder()
+        format_cell = encoder._cell_formatter()
+
+        self.assertEqual(
+            encoder._format_column([0.5, -0.0, 1.5e-7, 3.0], format_cell),
+            ['0.5', '0.0', '1.5e-07', '3.0']
+        )
+        self.assertEqual(
+            encoder._format_column([2.5, 1e16, float('inf')], format_cell),
+            ['2.5', '10000000000000000.0', 'null']
+        )
+
     def test_irregular_schema(self):
         """Test handling of lists with irregular schemas (different keys)."""
         data = [
@@ -41,6 +55,21 @@ class TestZonCoreFeatures(unittest.TestCase):
         self.assertNotIn("email", decoded[0])
         self.assertNotIn("role", decoded[0])
 
+    def test_irregularity_score(self):
+        """Test that repeated row shapes are weighted by how often they occur."""
+        encoder = zon.ZonEncoder()
+
+        self.assertEqual(encoder._calculate_irregularity([{"a": 1}] * 4), 0.0)
+        self.assertEqual(encoder._calculate_irregularity([{}, {}]), 0.0)
+        self.assertAlmostEqual(
+            encoder._calculate_irregularity([{"a": 1}, {"a": 2}, {"b": 3}]),
+            2 / 3
+        )
+        self.assertAlmostEqual(
+            encoder._calculate_irregularity([{"a": 1, "b": 2}, {"a": 3}, {"a": 4, "b": 5}]),
+            1 - (0.5 + 1.0 + 0.5) / 3
+        )
+
     def test_boolean_parsing(self):
         """Test parsing of various boolean representations."""
         self.assertEqual(zon.decode("val:T")["val"], True)
@@ -45,6 +45,24 @@ class TestDeltaEncoding(unittest.TestCase):
         decoded = self.decoder.decode(encoded)
         self.assertEqual(decoded, data)
 
+    def test_multiple_delta_columns(self):
+        """Test that each delta column is diffed against its own previous value."""
+        data = [{'a': i, 'b': 0.5 * i, 'c': 10 - 2 * i, 'name': 'n%d' % i} for i in range(5)]
+
+        encoded = self.encoder.encode(data)
+        self.assertIn('a:delta,b:delta,c:delta,name', encoded)
+        self.assertIn('\n0,0.0,10,n0\n+1,+0.5,-2,n1\n', encoded)
+
+        decoded = self.decoder.decode(encoded)
+        self.assertEqual(decoded, data)
+
+    def test_delta_across_row_blocks(self):
+        """Test that delta sums continue across the decoder's row blocks."""
+        data = [{'t': 3 * i + (i % 2) * 0.25, 'v': (i * 7) % 11 - 5} for i in range(5000)]
+
+        decoded = self.decoder.decode(self.encoder.encode(data))
+        self.assertEqual(decoded, data)
+
     def test_fallback_standard(self):
         """Test that delta encoding is not used for short sequences."""
         data = [
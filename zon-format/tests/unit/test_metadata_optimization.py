@@ -47,5 +47,15 @@ class TestMetadataOptimization(unittest.TestCase):
         decoded = self.decoder.decode(encoded)
         self.assertEqual(decoded, data)
 
+    def test_metadata_key_order(self):
+        """Test sorted metadata keys by default and insertion order on request."""
+        data = {'zeta': 1, 'alpha': 'x', 'mid': [1, 2]}
+
+        self.assertEqual(self.encoder.encode(data), 'alpha:x\nmid[1,2]\nzeta:1')
+
+        unsorted = ZonEncoder(sort_keys=False).encode(data)
+        self.assertEqual(unsorted, 'zeta:1\nalpha:x\nmid[1,2]')
+        self.assertEqual(list(self.decoder.decode(unsorted)), ['zeta', 'alpha', 'mid'])
+
 if __name__ == '__main__':
     unittest.main()
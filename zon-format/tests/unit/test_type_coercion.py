@@ -28,6 +28,17 @@ class TestTypeCoercion(unittest.TestCase):
         self.assertIsInstance(decoded[0]['score'], int)
         self.assertEqual(decoded[0]['id'], 1)
 
+    def test_coercion_leaves_input_rows_unchanged(self):
+        """Test that coercing flat rows does not rewrite the caller's data."""
+        data = [
+            {'id': '1', 'score': '95'},
+            {'id': '2', 'score': '87'}
+        ]
+
+        ZonEncoder(enable_type_coercion=True).encode(data)
+
+        self.assertEqual(data[0], {'id': '1', 'score': '95'})
+
     def test_not_coerce_when_disabled(self):
         """Test that coercion does not happen when disabled."""
         data = [